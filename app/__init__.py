@@ -3,26 +3,39 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
+from flask_migrate import Migrate
 from app.config import Config
 
 db = SQLAlchemy()
 bcrypt = Bcrypt()
 jwt = JWTManager()
+migrate = Migrate()
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Stored payloads are spliced into responses without being re-encoded
+    from app.encoding import RawJSONProvider
+    app.json = RawJSONProvider(app)
+
     # Enable CORS for all routes
     CORS(app)
 
     db.init_app(app)
     bcrypt.init_app(app)
     jwt.init_app(app)
+    migrate.init_app(app, db)
 
     from app import routes
     app.register_blueprint(routes.bp)
 
+    from app.auth import forget_current_user
+    app.before_request(forget_current_user)
+
+    from app.commands import register_commands
+    register_commands(app)
+
     # Initialize the database
     with app.app_context():
         db.create_all()
@@ -0,0 +1,255 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from flask import current_app
+
+from app import db
+from app.catalog import CatalogCache
+from app.models import ExamResult, UserLevel, UserQuestionAnswer
+
+
+PERCENTILES = (10, 25, 50, 75, 90)
+HISTOGRAM_BUCKETS = 10  # Equal-width score buckets between 0 and 100
+UNANSWERED = {
+    "attempts": 0,
+    "mean_score": None,
+    "median_score": None,
+    "p25_score": None,
+    "p75_score": None,
+    "difficulty": None,
+}
+
+
+def _number(value, digits=2):
+    """Round a numpy/pandas scalar for JSON, turning NaN into None"""
+    if value is None or pd.isna(value):
+        return None
+    return round(float(value), digits)
+
+
+class CohortAnalytics:
+    """Helper class for computing cohort analytics across all users.
+
+    Enrollments, exam results and answers are each loaded with one query into
+    a DataFrame and aggregated with vectorized group-bys. The result is cached
+    in-process, keyed by the catalog version and the current period of
+    ``COHORT_ANALYTICS_MAX_AGE`` seconds. Catalog changes show up at once;
+    new progress shows up in the next period, so progress writes never have
+    to invalidate anything shared by all users.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_version():
+        """Return the version of the data the analytics are computed from"""
+        # Periods are aligned to the epoch, so all processes switch together
+        period = int(time.time() // current_app.config["COHORT_ANALYTICS_MAX_AGE"])
+        return [CatalogCache.get_version(), period]
+
+    @classmethod
+    def get(cls, version=None):
+        """Return the cached analytics, recomputing them if the data moved on"""
+        if version is None:
+            version = cls.get_version()
+        state = current_app.extensions.setdefault("cohort_analytics", {})
+        cached = state.get("result")
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with cls._lock:
+            cached = state.get("result")
+            if cached is None or cached[0] != version:
+                # As with the catalog, the version is read before the data,
+                # so a concurrent write can only cause a needless recompute
+                result = cls.compute(
+                    CatalogCache.get_catalog(), *cls._load_frames()
+                )
+                result["data_version"] = version
+                cached = (version, result)
+                state["result"] = cached
+        return cached[1]
+
+    @staticmethod
+    def _frame(statement, columns, float_columns=()):
+        frame = pd.DataFrame.from_records(
+            db.session.execute(statement).all(), columns=columns
+        )
+        return frame.astype({column: "float64" for column in float_columns})
+
+    @staticmethod
+    def _load_frames():
+        """Return the (enrollments, exams, answers) DataFrames"""
+        enrollments = CohortAnalytics._frame(
+            db.select(
+                UserLevel.level_id,
+                UserLevel.is_completed,
+                UserLevel.initial_exam_score,
+                UserLevel.final_exam_score,
+            ),
+            ["level_id", "is_completed", "initial_score", "final_score"],
+            float_columns=("initial_score", "final_score"),
+        )
+        exams = CohortAnalytics._frame(
+            db.select(ExamResult.level_id, ExamResult.type, ExamResult.percentage),
+            ["level_id", "type", "percentage"],
+            float_columns=("percentage",),
+        )
+        answers = CohortAnalytics._frame(
+            db.select(UserQuestionAnswer.question_id, UserQuestionAnswer.percentage),
+            ["question_id", "percentage"],
+            float_columns=("percentage",),
+        )
+        return enrollments, exams, answers
+
+    @staticmethod
+    def _score_distributions(exams):
+        """Return {(level_id, type): distribution dict} of exam scores"""
+        if exams.empty:
+            return {}
+
+        grouped = exams.groupby(["level_id", "type"])["percentage"]
+        summary = grouped.agg(["count", "mean", "std", "min", "max"])
+        quantiles = grouped.quantile([p / 100 for p in PERCENTILES]).unstack()
+
+        buckets = np.minimum(
+            (exams["percentage"].clip(0, 100) // (100 / HISTOGRAM_BUCKETS)).astype(int),
+            HISTOGRAM_BUCKETS - 1,
+        )
+        histograms = (
+            exams.assign(bucket=buckets)
+            .groupby(["level_id", "type", "bucket"])
+            .size()
+            .unstack(fill_value=0)
+            .reindex(columns=range(HISTOGRAM_BUCKETS), fill_value=0)
+        )
+
+        return {
+            key: {
+                "count": int(row["count"]),
+                "mean": _number(row["mean"]),
+                "std": _number(row["std"]),
+                "min": _number(row["min"]),
+                "max": _number(row["max"]),
+                "percentiles": {
+                    f"p{p}": _number(quantiles.loc[key, p / 100]) for p in PERCENTILES
+                },
+                "histogram": [int(count) for count in histograms.loc[key]],
+            }
+            for key, row in summary.iterrows()
+        }
+
+    @staticmethod
+    def _improvements(enrollments):
+        """Return {level_id: improvement dict} from initial to final exam"""
+        scored = enrollments.dropna(subset=["initial_score", "final_score"])
+        if scored.empty:
+            return {}
+
+        difference = scored["final_score"] - scored["initial_score"]
+        scored = scored.assign(
+            difference=difference, improved=(difference > 0) * 100.0
+        )
+        summary = scored.groupby("level_id").agg(
+            users=("difference", "size"),
+            mean=("difference", "mean"),
+            median=("difference", "median"),
+            mean_initial=("initial_score", "mean"),
+            mean_final=("final_score", "mean"),
+            improved_share=("improved", "mean"),
+        )
+        return {
+            level_id: {
+                "users": int(row["users"]),
+                "mean": _number(row["mean"]),
+                "median": _number(row["median"]),
+                "mean_initial_score": _number(row["mean_initial"]),
+                "mean_final_score": _number(row["mean_final"]),
+                "improved_share": _number(row["improved_share"]),
+            }
+            for level_id, row in summary.iterrows()
+        }
+
+    @staticmethod
+    def _question_difficulty(answers):
+        """Return {question_id: answer score statistics}"""
+        if answers.empty:
+            return {}
+
+        grouped = answers.groupby("question_id")["percentage"]
+        summary = pd.DataFrame(
+            {
+                "attempts": grouped.size(),
+                "mean_score": grouped.mean(),
+                "median_score": grouped.median(),
+                "p25_score": grouped.quantile(0.25),
+                "p75_score": grouped.quantile(0.75),
+            }
+        )
+        summary["difficulty"] = 100 - summary["mean_score"]
+        return {
+            question_id: {
+                "attempts": int(row["attempts"]),
+                **{
+                    column: _number(row[column])
+                    for column in summary.columns
+                    if column != "attempts"
+                },
+            }
+            for question_id, row in summary.iterrows()
+        }
+
+    @staticmethod
+    def compute(catalog, enrollments, exams, answers):
+        """Compute the analytics of every catalog level from the DataFrames"""
+        counts = (
+            enrollments.astype({"is_completed": "bool"})
+            .groupby("level_id")
+            .agg(enrolled=("is_completed", "size"), completed=("is_completed", "sum"))
+            .to_dict("index")
+        )
+        distributions = CohortAnalytics._score_distributions(exams)
+        improvements = CohortAnalytics._improvements(enrollments)
+        difficulty = CohortAnalytics._question_difficulty(answers)
+
+        levels = []
+        for level in catalog.levels:
+            level_counts = counts.get(level.id, {})
+            enrolled = int(level_counts.get("enrolled", 0))
+            completed = int(level_counts.get("completed", 0))
+
+            questions = [
+                {
+                    "question_id": question.id,
+                    "video_id": video_id,
+                    "text": question.text,
+                    **difficulty.get(question.id, UNANSWERED),
+                }
+                for video_id in catalog.video_sequence(level.id)
+                for question in catalog.questions_for_video(video_id)
+            ]
+
+            levels.append(
+                {
+                    "level_id": level.id,
+                    "name": level.name,
+                    "level_number": level.level_number,
+                    "enrolled_users": enrolled,
+                    "completed_users": completed,
+                    "completion_rate": round(
+                        (completed / enrolled * 100) if enrolled > 0 else 0, 2
+                    ),
+                    "initial_exam": distributions.get((level.id, "initial")),
+                    "final_exam": distributions.get((level.id, "final")),
+                    "improvement": improvements.get(level.id),
+                    # Hardest first; unanswered questions have no difficulty yet
+                    "questions": sorted(
+                        questions,
+                        key=lambda q: (q["difficulty"] is None, -(q["difficulty"] or 0)),
+                    ),
+                }
+            )
+
+        return {"levels": levels, "histogram_buckets": HISTOGRAM_BUCKETS}
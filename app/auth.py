@@ -1,18 +1,45 @@
 from functools import wraps
-from flask import jsonify, request
-from flask_jwt_extended import jwt_required, get_jwt_identity, create_access_token
+from flask import jsonify, request, g, current_app
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity, create_access_token
 from app.models import User
 from app import bcrypt
 from app.localization import LocalizationHelper
 from app.validation import ValidationHelper
 
+def forget_current_user():
+    """Drop the user cached by ``get_current_user``.
+
+    Registered to run before every request: ``g`` lives as long as the app
+    context, which a request shares when one is already pushed.
+    """
+    g.pop("current_user", None)
+
+def get_current_user():
+    """Return the authenticated user, loading it at most once per request"""
+    if "current_user" not in g:
+        current_user_id = get_jwt_identity()
+        g.current_user = User.query.get(int(current_user_id)) if current_user_id else None
+    return g.current_user
+
+def get_current_role():
+    """Return the authenticated user's role.
+
+    With JWT_TRUST_ROLE_CLAIM enabled the role is read from the token claim
+    and the database is not touched; otherwise the user is loaded once per
+    request. Returns None if the user no longer exists.
+    """
+    if current_app.config.get('JWT_TRUST_ROLE_CLAIM'):
+        role = get_jwt().get('role')
+        if role:
+            return role
+    user = get_current_user()
+    return user.role if user else None
+
 def admin_required(f):
     @wraps(f)
     @jwt_required()
     def decorated_function(*args, **kwargs):
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        if not user or user.role != 'admin':
+        if get_current_role() != 'admin':
             lang = ValidationHelper.get_language_from_request()
             return LocalizationHelper.get_error_response('admin_access_required', lang, 403)
         return f(*args, **kwargs)
@@ -22,14 +49,22 @@ def client_required(f):
     @wraps(f)
     @jwt_required()
     def decorated_function(*args, **kwargs):
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        if not user:
+        if not get_current_role():
             lang = ValidationHelper.get_language_from_request()
             return LocalizationHelper.get_error_response('authentication_required', lang, 401)
         return f(*args, **kwargs)
     return decorated_function
 
+def admin_or_client_required(f):
+    @wraps(f)
+    @jwt_required()
+    def decorated_function(*args, **kwargs):
+        if get_current_role() not in ['admin', 'client']:
+            lang = ValidationHelper.get_language_from_request()
+            return LocalizationHelper.get_error_response('access_denied', lang, 403)
+        return f(*args, **kwargs)
+    return decorated_function
+
 def authenticate_user(email, password):
     user = User.query.filter_by(email=email).first()
     if user and bcrypt.check_password_hash(user.password, password):
@@ -37,4 +72,4 @@ def authenticate_user(email, password):
     return None
 
 def create_user_token(user):
-    return create_access_token(identity=str(user.id))
\ No newline at end of file
+    return create_access_token(identity=str(user.id), additional_claims={'role': user.role})
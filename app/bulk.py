@@ -0,0 +1,95 @@
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import db
+
+
+class BulkWriter:
+    """Helper class for dialect-aware set-based write statements"""
+
+    @staticmethod
+    def _dialect_insert(model):
+        dialect = db.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(model)
+        if dialect == "sqlite":
+            return sqlite.insert(model)
+        return None
+
+    @classmethod
+    def insert_ignore(cls, model, rows, index_elements):
+        """Insert many rows in one statement, skipping rows that already exist.
+
+        Uses ``INSERT ... ON CONFLICT (index_elements) DO NOTHING`` where the
+        database supports it, so retrying the same insert is harmless while
+        any other constraint violation still raises.
+        """
+        if not rows:
+            return
+
+        stmt = cls._dialect_insert(model)
+        if stmt is not None:
+            stmt = stmt.values(rows).on_conflict_do_nothing(index_elements=index_elements)
+        else:
+            stmt = db.insert(model).values(rows)
+        db.session.execute(stmt)
+
+    @classmethod
+    def upsert(cls, model, rows, index_elements, update_columns, returning=True):
+        """Insert rows or update the existing ones in a single statement.
+
+        ``index_elements`` name the columns of the unique constraint the rows
+        may collide on; on conflict only ``update_columns`` are overwritten.
+        Returns the stored model instances, refreshed from the database,
+        unless ``returning`` is False.
+        """
+        if not rows:
+            return []
+
+        stmt = cls._dialect_insert(model)
+        if stmt is None:
+            return cls._upsert_by_select(
+                model, rows, index_elements, update_columns, returning
+            )
+        stmt = stmt.values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: stmt.excluded[column] for column in update_columns},
+        )
+        if not returning:
+            db.session.execute(stmt)
+            return None
+        return db.session.scalars(
+            stmt.returning(model), execution_options={"populate_existing": True}
+        ).all()
+
+    @staticmethod
+    def _upsert_by_select(model, rows, index_elements, update_columns, returning):
+        """Portable ``upsert`` for databases without ``ON CONFLICT``.
+
+        Loads the colliding rows with one SELECT, then updates them and
+        inserts the rest through the session. Unlike the native statement,
+        two transactions inserting the same new key concurrently make the
+        later one fail with an IntegrityError.
+        """
+        keys = [tuple(row[name] for name in index_elements) for row in rows]
+        key_columns = tuple_(*(getattr(model, name) for name in index_elements))
+        existing = {
+            tuple(getattr(instance, name) for name in index_elements): instance
+            for instance in model.query.filter(key_columns.in_(keys))
+            .populate_existing()
+            .all()
+        }
+
+        stored = []
+        for key, row in zip(keys, rows):
+            instance = existing.get(key)
+            if instance is None:
+                instance = existing[key] = model(**row)
+                db.session.add(instance)
+            else:
+                for column in update_columns:
+                    setattr(instance, column, row[column])
+            stored.append(instance)
+        db.session.flush()
+        return stored if returning else None
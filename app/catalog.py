@@ -0,0 +1,175 @@
+import threading
+from collections import namedtuple
+
+from flask import current_app
+
+from app import db
+from app.models import CatalogVersion, Level, Video, Question
+
+
+CatalogLevel = namedtuple(
+    "CatalogLevel",
+    [
+        "id",
+        "name",
+        "description",
+        "level_number",
+        "welcome_video_url",
+        "image_path",
+        "price",
+        "initial_exam_question",
+        "final_exam_question",
+    ],
+)
+CatalogVideo = namedtuple(
+    "CatalogVideo", ["id", "level_id", "name", "youtube_link", "order"]
+)
+CatalogQuestion = namedtuple(
+    "CatalogQuestion", ["id", "video_id", "text", "order", "created_at"]
+)
+
+
+class Catalog:
+    """Immutable snapshot of the Level -> Video -> Question tree"""
+
+    def __init__(self, version, levels, videos, questions):
+        self.version = version
+        self.levels = tuple(sorted(levels, key=lambda l: (l.level_number, l.id)))
+        self.levels_by_id = {level.id: level for level in levels}
+        self.videos_by_id = {video.id: video for video in videos}
+
+        videos_by_level = {level.id: [] for level in levels}
+        for video in sorted(videos, key=lambda v: v.id):
+            videos_by_level.setdefault(video.level_id, []).append(video)
+        self.videos_by_level = {
+            level_id: tuple(level_videos)
+            for level_id, level_videos in videos_by_level.items()
+        }
+        # Videos are unlocked one after another in admin-controlled order
+        self.video_sequences = {
+            level_id: tuple(
+                video.id
+                for video in sorted(level_videos, key=lambda v: (v.order, v.id))
+            )
+            for level_id, level_videos in videos_by_level.items()
+        }
+
+        questions_by_video = {video.id: [] for video in videos}
+        for question in sorted(questions, key=lambda q: (q.order, q.id)):
+            questions_by_video.setdefault(question.video_id, []).append(question)
+        self.questions_by_video = {
+            video_id: tuple(video_questions)
+            for video_id, video_questions in questions_by_video.items()
+        }
+
+    def get_level(self, level_id):
+        return self.levels_by_id.get(level_id)
+
+    def get_video(self, video_id):
+        return self.videos_by_id.get(video_id)
+
+    def videos_for_level(self, level_id):
+        """Videos of a level, ordered like ``Level.videos``"""
+        return self.videos_by_level.get(level_id, ())
+
+    def video_sequence(self, level_id):
+        """Video ids of a level in the order users unlock them"""
+        return self.video_sequences.get(level_id, ())
+
+    def next_video_id(self, level_id, video_id):
+        """Id of the video unlocked after ``video_id``, or None"""
+        sequence = self.video_sequence(level_id)
+        if video_id not in sequence:
+            return None
+        index = sequence.index(video_id)
+        return sequence[index + 1] if index + 1 < len(sequence) else None
+
+    def questions_for_video(self, video_id):
+        """Questions of a video, ordered by question order"""
+        return self.questions_by_video.get(video_id, ())
+
+
+class CatalogCache:
+    """Helper class for serving the catalog from an in-process cache.
+
+    The catalog only changes through admin write routes, which call
+    ``bump_version`` in the same transaction as their change. Every read
+    compares the cached snapshot against the version stored in the database,
+    so all worker processes pick up a change on their next request.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_version():
+        """Return the current catalog version stored in the database"""
+        version = db.session.query(CatalogVersion.version).filter_by(id=1).scalar()
+        return version or 0
+
+    @staticmethod
+    def bump_version():
+        """Invalidate every cached catalog once the current transaction commits.
+
+        The row is created with the table, so this is a single atomic UPDATE.
+        """
+        CatalogVersion.query.filter_by(id=1).update(
+            {CatalogVersion.version: CatalogVersion.version + 1},
+            synchronize_session=False,
+        )
+
+    @classmethod
+    def get_catalog(cls):
+        """Return the cached catalog, rebuilding it if the version moved on"""
+        version = cls.get_version()
+        state = current_app.extensions.setdefault("catalog_cache", {})
+        catalog = state.get("catalog")
+        if catalog is not None and catalog.version == version:
+            return catalog
+
+        with cls._lock:
+            catalog = state.get("catalog")
+            if catalog is None or catalog.version != version:
+                # The version is read before the tree, so a concurrent write
+                # can only make this snapshot newer than its version, never
+                # older; the next read then simply rebuilds it again
+                catalog = cls._build_catalog(version)
+                state["catalog"] = catalog
+        return catalog
+
+    @staticmethod
+    def _build_catalog(version):
+        levels = [
+            CatalogLevel(
+                id=level.id,
+                name=level.name,
+                description=level.description,
+                level_number=level.level_number,
+                welcome_video_url=level.welcome_video_url,
+                image_path=level.image_path,
+                price=level.price,
+                initial_exam_question=level.initial_exam_question,
+                final_exam_question=level.final_exam_question,
+            )
+            for level in Level.query.all()
+        ]
+        videos = [
+            CatalogVideo(
+                id=video.id,
+                level_id=video.level_id,
+                name=video.name,
+                youtube_link=video.youtube_link,
+                order=video.order,
+            )
+            for video in Video.query.all()
+        ]
+        questions = [
+            CatalogQuestion(
+                id=question.id,
+                video_id=question.video_id,
+                text=question.text,
+                order=question.order,
+                created_at=question.created_at,
+            )
+            for question in Question.query.all()
+        ]
+        return Catalog(version, levels, videos, questions)
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+import matplotlib
+from flask import current_app
+from matplotlib.figure import Figure
+
+from app.catalog import CatalogCache
+from app.loaders import ProgressLoader
+from app.models import UserLevel
+from app.rendering import RenderPool, write_file_atomically
+
+
+# Bump when the chart layout changes so that previously cached images are unused
+CHART_LAYOUT_VERSION = 1
+
+CHART_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+INITIAL_COLOR = "#f39c12"
+FINAL_COLOR = "#27ae60"
+LEVEL_COLORS = ["#3498db", "#9b59b6", "#1abc9c", "#e67e22", "#e74c3c", "#34495e"]
+
+
+def _draw_video_scores(figure, data):
+    videos = data["videos"]
+    axes = figure.subplots()
+    if not videos:
+        axes.text(0.5, 0.5, "No videos yet", ha="center", va="center")
+        axes.set_axis_off()
+        return
+
+    positions = range(len(videos))
+    level_numbers = sorted({video["level_number"] for video in videos})
+    bars = axes.barh(
+        positions,
+        [video["score"] or 0 for video in videos],
+        color=[
+            LEVEL_COLORS[level_numbers.index(video["level_number"]) % len(LEVEL_COLORS)]
+            for video in videos
+        ],
+    )
+    for bar, video in zip(bars, videos):
+        label = "-" if video["score"] is None else f"{video['score']:.0f}%"
+        axes.annotate(
+            label,
+            (bar.get_width(), bar.get_y() + bar.get_height() / 2),
+            xytext=(3, 0),
+            textcoords="offset points",
+            va="center",
+            fontsize=8,
+        )
+    axes.set_yticks(
+        list(positions),
+        [f"L{video['level_number']} · {video['video_name']}" for video in videos],
+        fontsize=8,
+    )
+    axes.invert_yaxis()
+    axes.set_xlim(0, 110)
+    axes.set_xlabel("Average answer score (%)")
+    axes.set_title("Scores per video")
+
+
+def _draw_exam_scores(figure, data):
+    levels = data["levels"]
+    axes = figure.subplots()
+    if not levels:
+        axes.text(0.5, 0.5, "No levels yet", ha="center", va="center")
+        axes.set_axis_off()
+        return
+
+    width = 0.38
+    positions = range(len(levels))
+    for offset, key, label, color in (
+        (-width / 2, "initial", "Initial exam", INITIAL_COLOR),
+        (width / 2, "final", "Final exam", FINAL_COLOR),
+    ):
+        bars = axes.bar(
+            [position + offset for position in positions],
+            [level[key] or 0 for level in levels],
+            width,
+            label=label,
+            color=color,
+        )
+        axes.bar_label(
+            bars,
+            labels=["-" if level[key] is None else f"{level[key]:.0f}" for level in levels],
+            fontsize=8,
+        )
+    axes.set_xticks(
+        list(positions),
+        [f"L{level['level_number']}" for level in levels],
+    )
+    axes.set_ylim(0, 110)
+    axes.set_ylabel("Score (%)")
+    axes.set_title("Initial versus final exam")
+    axes.legend(loc="upper left", fontsize=8)
+
+
+CHART_DRAWERS = {
+    "video_scores": _draw_video_scores,
+    "exam_scores": _draw_exam_scores,
+}
+
+
+def render_chart(chart, data, fmt):
+    """Render a chart from its data into PNG or SVG bytes.
+
+    Runs in a ``RenderPool`` worker process, so it only gets plain data.
+    Figures are created without pyplot, which keeps no global state.
+    """
+    rows = len(data.get("videos", ())) if chart == "video_scores" else 0
+    figure = Figure(figsize=(7, max(3.5, 0.3 * rows + 1.5)), layout="constrained")
+    CHART_DRAWERS[chart](figure, data)
+
+    buffer = BytesIO()
+    # No timestamps or random ids, so equal data always yields equal bytes
+    metadata = {"Date": None} if fmt == "svg" else {"Software": None}
+    with matplotlib.rc_context({"svg.hashsalt": f"chart-{CHART_LAYOUT_VERSION}"}):
+        figure.savefig(buffer, format=fmt, dpi=100, metadata=metadata)
+    return buffer.getvalue()
+
+
+class ChartData:
+    """Helper class for loading the plain data a chart is drawn from"""
+
+    @staticmethod
+    def video_scores(user_id):
+        """Average answer score of every video in the user's levels"""
+        catalog = CatalogCache.get_catalog()
+        level_ids = [
+            level_id
+            for (level_id,) in UserLevel.query.with_entities(UserLevel.level_id)
+            .filter_by(user_id=user_id)
+            .order_by(UserLevel.id)
+        ]
+        video_ids = [
+            video_id
+            for level_id in level_ids
+            for video_id in catalog.video_sequence(level_id)
+        ]
+        answers = ProgressLoader.load_answers(
+            user_id,
+            [
+                question.id
+                for video_id in video_ids
+                for question in catalog.questions_for_video(video_id)
+            ],
+        )
+
+        videos = []
+        for video_id in video_ids:
+            video = catalog.get_video(video_id)
+            scores = [
+                answers[question.id].percentage
+                for question in catalog.questions_for_video(video_id)
+                if question.id in answers
+            ]
+            videos.append(
+                {
+                    "level_number": catalog.get_level(video.level_id).level_number,
+                    "video_name": video.name,
+                    "score": round(sum(scores) / len(scores), 2) if scores else None,
+                }
+            )
+        return {"videos": videos}
+
+    @staticmethod
+    def exam_scores(user_id):
+        """Initial and final exam score of every level the user owns"""
+        catalog = CatalogCache.get_catalog()
+        user_levels = (
+            UserLevel.query.with_entities(
+                UserLevel.level_id,
+                UserLevel.initial_exam_score,
+                UserLevel.final_exam_score,
+            )
+            .filter_by(user_id=user_id)
+            .order_by(UserLevel.id)
+            .all()
+        )
+        return {
+            "levels": [
+                {
+                    "level_number": catalog.get_level(level_id).level_number,
+                    "initial": initial,
+                    "final": final,
+                }
+                for level_id, initial, final in user_levels
+            ]
+        }
+
+
+class ChartCache:
+    """Helper class for serving chart images from an LRU and a disk cache.
+
+    Images are keyed by a hash of the chart's data, so a chart is only
+    rendered again once the data it shows changes. The most recently used
+    images are kept in process memory; all others are looked up on disk,
+    where every ``CHART_DISK_CACHE_PRUNE_EVERY`` writes the least recently
+    written files beyond ``CHART_DISK_CACHE_MAX_FILES`` are removed.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_key(chart, data, fmt):
+        parts = [CHART_LAYOUT_VERSION, chart, fmt, data]
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _memory():
+        return current_app.extensions.setdefault("chart_cache", OrderedDict())
+
+    @classmethod
+    def _remember(cls, key, image):
+        memory = cls._memory()
+        with cls._lock:
+            memory[key] = image
+            memory.move_to_end(key)
+            while len(memory) > current_app.config["CHART_MEMORY_CACHE_SIZE"]:
+                memory.popitem(last=False)
+
+    @classmethod
+    def _written(cls, folder):
+        """Count a write, pruning the disk cache every ``CHART_DISK_CACHE_PRUNE_EVERY`` writes"""
+        state = current_app.extensions.setdefault("chart_disk_cache", {"writes": 0})
+        with cls._lock:
+            state["writes"] += 1
+            due = state["writes"] % current_app.config["CHART_DISK_CACHE_PRUNE_EVERY"] == 0
+        if due:
+            cls._prune_disk(folder)
+
+    @staticmethod
+    def _prune_disk(folder):
+        """Remove the least recently written images beyond the size limit"""
+        max_files = current_app.config["CHART_DISK_CACHE_MAX_FILES"]
+        entries = []
+        for entry in os.scandir(folder):
+            # Temporary files belong to writes still in progress
+            if entry.name.endswith(".tmp") or not entry.is_file():
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass  # Pruned concurrently by another process
+        if len(entries) <= max_files:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @classmethod
+    def get_or_render(cls, chart, data, fmt, key):
+        """Return the image bytes of a chart, rendering them if needed.
+
+        Returns None when the render pool is saturated.
+        """
+        memory = cls._memory()
+        with cls._lock:
+            image = memory.get(key)
+            if image is not None:
+                memory.move_to_end(key)
+                return image
+
+        folder = current_app.config["CHART_CACHE_FOLDER"]
+        path = os.path.join(folder, f"{key}.{fmt}")
+        try:
+            with open(path, "rb") as image_file:
+                image = image_file.read()
+        except FileNotFoundError:
+            image = RenderPool.run(render_chart, chart, data, fmt)
+            if image is None:
+                return None
+            write_file_atomically(path, image)
+            cls._written(folder)
+
+        cls._remember(key, image)
+        return image
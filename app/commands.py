@@ -0,0 +1,116 @@
+import click
+from flask.cli import with_appcontext
+
+from app import db
+from app.models import (
+    ExamResult,
+    Question,
+    UserLevel,
+    UserQuestionAnswer,
+    UserVideoProgress,
+    Video,
+)
+from app.payloads import PayloadStore
+from app.progress import ProgressCounters
+from app.statistics import PlatformCounters
+
+
+@click.command("recount-progress")
+@with_appcontext
+def recount_progress_command():
+    """Recompute every user level's completed video counter."""
+    updated = ProgressCounters.recount()
+    db.session.commit()
+    click.echo(f"Recounted completed videos for {updated} user levels")
+
+
+def _hot_queries():
+    """Representative shapes of the queries run on every user request"""
+    return [
+        ("enrollment lookup", db.select(UserLevel).where(UserLevel.user_id == 1, UserLevel.level_id == 1)),
+        ("video progress lookup", db.select(UserVideoProgress).where(
+            UserVideoProgress.user_level_id == 1, UserVideoProgress.video_id == 1
+        )),
+        ("answers of a user", db.select(UserQuestionAnswer).where(
+            UserQuestionAnswer.user_id == 1, UserQuestionAnswer.question_id.in_([1, 2])
+        )),
+        ("exam results of a user", db.select(ExamResult).where(
+            ExamResult.user_id == 1, ExamResult.level_id.in_([1, 2])
+        )),
+        ("progress rows per video", db.select(
+            UserVideoProgress.video_id, db.func.count(UserVideoProgress.id)
+        ).where(UserVideoProgress.video_id.in_([1, 2])).group_by(UserVideoProgress.video_id)),
+        ("answers per question", db.select(
+            UserQuestionAnswer.question_id, db.func.count(UserQuestionAnswer.id)
+        ).where(UserQuestionAnswer.question_id.in_([1, 2])).group_by(UserQuestionAnswer.question_id)),
+        ("videos of a level", db.select(Video).where(Video.level_id == 1).order_by(Video.order)),
+        ("questions of a video", db.select(Question).where(Question.video_id == 1).order_by(Question.order)),
+    ]
+
+
+def _explain(statement):
+    """Return (plan lines, whether the plan scans a whole table)"""
+    dialect = db.engine.dialect.name
+    sql = str(statement.compile(dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}))
+
+    if dialect == "sqlite":
+        rows = db.session.execute(db.text("EXPLAIN QUERY PLAN " + sql)).all()
+        lines = [row[-1] for row in rows]
+        return lines, any(line.startswith("SCAN ") and " USING " not in line for line in lines)
+
+    if dialect == "postgresql":
+        # Tiny tables are cheaper to scan, so ask whether an index *can* be used
+        db.session.execute(db.text("SET LOCAL enable_seqscan = off"))
+        lines = [row[0] for row in db.session.execute(db.text("EXPLAIN " + sql))]
+        return lines, any("Seq Scan" in line for line in lines)
+
+    lines = [str(row) for row in db.session.execute(db.text("EXPLAIN " + sql))]
+    return lines, False
+
+
+@click.command("explain-hot-queries")
+@with_appcontext
+def explain_hot_queries_command():
+    """Show the plans of the hot-path queries and fail if one scans a table."""
+    full_scans = []
+    for name, statement in _hot_queries():
+        lines, full_scan = _explain(statement)
+        click.echo(f"{name}:")
+        for line in lines:
+            click.echo(f"    {line}")
+        if full_scan:
+            full_scans.append(name)
+    db.session.rollback()
+
+    if full_scans:
+        raise click.ClickException("Full table scans in: " + ", ".join(full_scans))
+    click.echo("All hot-path queries use an index")
+
+
+@click.command("backfill-payloads")
+@click.option("--batch-size", default=1000, show_default=True, help="Rows moved per transaction.")
+@with_appcontext
+def backfill_payloads_command(batch_size):
+    """Move legacy SpeechAce payloads into the compressed side tables."""
+    moved = {}
+    for table, count in PayloadStore.backfill(batch_size):
+        moved[table] = count
+        click.echo(f"{table}: {count} payloads moved")
+    click.echo(f"Done, {sum(moved.values())} payloads moved using {PayloadStore.CODEC}")
+
+
+@click.command("rebuild-statistics")
+@with_appcontext
+def rebuild_statistics_command():
+    """Recompute the platform statistics counters from the source tables."""
+    levels = PlatformCounters.rebuild()
+    db.session.commit()
+    click.echo(f"Rebuilt platform statistics for {levels} levels")
+
+
+def register_commands(app):
+    """Register the maintenance commands with the Flask CLI"""
+    app.cli.add_command(recount_progress_command)
+    app.cli.add_command(explain_hot_queries_command)
+    app.cli.add_command(backfill_payloads_command)
+    app.cli.add_command(rebuild_statistics_command)
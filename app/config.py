@@ -6,6 +6,10 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'your_secret_key'
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt_secret_key'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
+    # Trust the role claim embedded in access tokens instead of loading the user
+    # on every request. Role changes and deleted users then only take effect
+    # once the token expires.
+    JWT_TRUST_ROLE_CLAIM = os.environ.get('JWT_TRUST_ROLE_CLAIM', 'false').lower() == 'true'
     
     # PostgreSQL Database with URL-encoded password
     password = quote_plus('F1@sk_P0stgr3s_2024!S3cur3')
@@ -15,4 +19,20 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     UPLOAD_FOLDER = os.path.join(os.getcwd(), 'Uploads', 'levels')
     PROFILE_UPLOAD_FOLDER = os.path.join(os.getcwd(), 'Uploads', 'profiles')  # NEW
-    MAX_PROFILE_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB limit  # NEW    
\ No newline at end of file
+    MAX_PROFILE_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB limit  # NEW
+    ANSWER_EXPORT_BATCH_SIZE = 1000  # Rows fetched per round trip when streaming exports
+    # Adding a video to a level with more owners than this fans out progress rows in a background job
+    PROGRESS_FANOUT_BACKGROUND_THRESHOLD = 5000
+    PROGRESS_FANOUT_BATCH_SIZE = 5000  # Enrollments covered per committed fan-out batch
+    ANSWER_BATCH_MAX_SIZE = 100  # Answers accepted by one batch submission
+    USER_STATISTICS_BATCH_MAX_SIZE = 500  # Users accepted by one bulk statistics request
+    COHORT_ANALYTICS_MAX_AGE = 300  # Seconds cohort analytics may lag behind new progress
+    # Reports and charts are rendered in a per-process pool of worker processes
+    RENDER_POOL_WORKERS = 2
+    RENDER_POOL_MAX_PENDING = 8  # Renders queued or running before requests are turned away
+    RENDER_TIMEOUT = 60  # Seconds a request waits for its render
+    REPORT_CACHE_FOLDER = os.path.join(os.getcwd(), 'cache', 'reports')
+    CHART_CACHE_FOLDER = os.path.join(os.getcwd(), 'cache', 'charts')
+    CHART_MEMORY_CACHE_SIZE = 256  # Chart images kept in process memory
+    CHART_DISK_CACHE_MAX_FILES = 10000
+    CHART_DISK_CACHE_PRUNE_EVERY = 100  # Chart writes per process between prunes of the folder
@@ -0,0 +1,120 @@
+import os
+
+from flask import current_app
+
+from app import db
+from app.jobs import BackgroundJobs
+from app.models import (
+    ExamResult,
+    ExamResultPayload,
+    Level,
+    Question,
+    User,
+    UserLevel,
+    UserProgressVersion,
+    UserQuestionAnswer,
+    UserQuestionAnswerPayload,
+    UserVideoProgress,
+    Video,
+)
+from app.progress import ProgressCounters
+
+
+class CascadeDelete:
+    """Helper class for deleting rows together with everything that references them.
+
+    Dependants are removed with one set-based DELETE per table, children
+    before parents, so nothing is loaded into the session no matter how many
+    users own a level. Uploaded files are removed in the background once the
+    transaction has committed, see ``remove_uploads_later``.
+    """
+
+    @staticmethod
+    def _delete_where(model, *criteria):
+        return model.query.filter(*criteria).delete(synchronize_session=False)
+
+    @staticmethod
+    def _delete_answers(*criteria):
+        answer_ids = db.select(UserQuestionAnswer.id).where(*criteria)
+        CascadeDelete._delete_where(UserQuestionAnswerPayload, UserQuestionAnswerPayload.answer_id.in_(answer_ids))
+        CascadeDelete._delete_where(UserQuestionAnswer, *criteria)
+
+    @staticmethod
+    def _delete_exam_results(*criteria):
+        exam_result_ids = db.select(ExamResult.id).where(*criteria)
+        CascadeDelete._delete_where(ExamResultPayload, ExamResultPayload.exam_result_id.in_(exam_result_ids))
+        CascadeDelete._delete_where(ExamResult, *criteria)
+
+    @staticmethod
+    def delete_question(question_id):
+        """Delete a question with its answers"""
+        CascadeDelete._delete_answers(UserQuestionAnswer.question_id == question_id)
+        CascadeDelete._delete_where(Question, Question.id == question_id)
+
+    @staticmethod
+    def delete_video(video_id):
+        """Delete a video with its questions, answers and progress rows"""
+        question_ids = db.select(Question.id).where(Question.video_id == video_id)
+
+        ProgressCounters.discount_video(video_id)
+        CascadeDelete._delete_answers(UserQuestionAnswer.question_id.in_(question_ids))
+        CascadeDelete._delete_where(Question, Question.video_id == video_id)
+        CascadeDelete._delete_where(UserVideoProgress, UserVideoProgress.video_id == video_id)
+        CascadeDelete._delete_where(Video, Video.id == video_id)
+
+    @staticmethod
+    def delete_level(level_id):
+        """Delete a level with its videos, questions, enrollments and their progress"""
+        video_ids = db.select(Video.id).where(Video.level_id == level_id)
+        question_ids = db.select(Question.id).where(Question.video_id.in_(video_ids))
+        user_level_ids = db.select(UserLevel.id).where(UserLevel.level_id == level_id)
+
+        CascadeDelete._delete_answers(UserQuestionAnswer.question_id.in_(question_ids))
+        CascadeDelete._delete_where(Question, Question.video_id.in_(video_ids))
+        CascadeDelete._delete_where(
+            UserVideoProgress,
+            UserVideoProgress.user_level_id.in_(user_level_ids) | UserVideoProgress.video_id.in_(video_ids),
+        )
+        CascadeDelete._delete_where(UserLevel, UserLevel.level_id == level_id)
+        CascadeDelete._delete_exam_results(ExamResult.level_id == level_id)
+        CascadeDelete._delete_where(Video, Video.level_id == level_id)
+        CascadeDelete._delete_where(Level, Level.id == level_id)
+
+    @staticmethod
+    def delete_user(user_id):
+        """Delete a user with their enrollments, progress, answers and exams"""
+        user_level_ids = db.select(UserLevel.id).where(UserLevel.user_id == user_id)
+
+        CascadeDelete._delete_where(UserVideoProgress, UserVideoProgress.user_level_id.in_(user_level_ids))
+        CascadeDelete._delete_where(UserLevel, UserLevel.user_id == user_id)
+        CascadeDelete._delete_exam_results(ExamResult.user_id == user_id)
+        CascadeDelete._delete_answers(UserQuestionAnswer.user_id == user_id)
+        CascadeDelete._delete_where(UserProgressVersion, UserProgressVersion.user_id == user_id)
+        CascadeDelete._delete_where(User, User.id == user_id)
+
+    @staticmethod
+    def _upload_file_path(url):
+        """Map an ``/Uploads/...`` URL to its file on disk, or None"""
+        folders = {
+            "/Uploads/levels/": current_app.config["UPLOAD_FOLDER"],
+            "/Uploads/profiles/": current_app.config["PROFILE_UPLOAD_FOLDER"],
+        }
+        for prefix, folder in folders.items():
+            if url and url.startswith(prefix):
+                return os.path.join(folder, os.path.basename(url[len(prefix):]))
+        return None
+
+    @staticmethod
+    def _remove_files(paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Already gone or not removable; nothing references it anymore
+
+    @staticmethod
+    def remove_uploads_later(*urls):
+        """Remove uploaded files in the background. Call after committing."""
+        paths = [path for path in map(CascadeDelete._upload_file_path, urls) if path]
+        if paths:
+            BackgroundJobs.defer(CascadeDelete._remove_files, paths)
@@ -0,0 +1,46 @@
+import re
+import uuid
+
+from flask.json.provider import DefaultJSONProvider
+
+
+class RawJSON:
+    """Already-encoded JSON text that is written into a response as is.
+
+    Lets stored payloads reach the client without being parsed into Python
+    objects only to be serialized again.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __repr__(self):
+        return f"RawJSON({len(self.text)} chars)"
+
+
+class RawJSONProvider(DefaultJSONProvider):
+    """JSON provider that splices ``RawJSON`` values into the output.
+
+    Each ``RawJSON`` is first encoded as a unique placeholder string, which
+    is then replaced by the raw text in a single pass over the output.
+    """
+
+    def dumps(self, obj, **kwargs):
+        raw_texts = []
+        token = f"__raw_json_{uuid.uuid4().hex}_"
+        fallback = kwargs.pop("default", self.default)
+
+        def default(o):
+            if isinstance(o, RawJSON):
+                raw_texts.append(o.text)
+                return f"{token}{len(raw_texts) - 1}"
+            return fallback(o)
+
+        encoded = super().dumps(obj, default=default, **kwargs)
+        if not raw_texts:
+            return encoded
+        return re.sub(
+            f'"{token}(\\d+)"', lambda match: raw_texts[int(match.group(1))], encoded
+        )
@@ -0,0 +1,110 @@
+import threading
+from datetime import datetime
+
+from flask import current_app
+
+from app import db
+from app.catalog import CatalogCache
+from app.models import BackgroundJob
+from app.progress import ProgressProvisioner
+
+
+class BackgroundJobs:
+    """Helper class for running long admin operations outside the request.
+
+    Jobs run in a daemon thread of the current process with their own app
+    context and database session. Their state and progress are stored in the
+    ``BackgroundJob`` table so any worker can report on them.
+    """
+
+    @staticmethod
+    def create(job_type, total):
+        """Add a pending job to the current transaction and return it"""
+        job = BackgroundJob(job_type=job_type, status="pending", total=total)
+        db.session.add(job)
+        db.session.flush()
+        return job
+
+    @staticmethod
+    def start(job_id, target, *args):
+        """Run ``target(job, *args)`` in the background.
+
+        Call only after the transaction that created the job has committed.
+        ``target`` may commit between steps to publish progress.
+        """
+        app = current_app._get_current_object()
+        thread = threading.Thread(
+            target=BackgroundJobs._run,
+            args=(app, job_id, target, args),
+            name=f"background-job-{job_id}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    @staticmethod
+    def defer(target, *args):
+        """Run ``target(*args)`` in the background without tracking it.
+
+        Meant for best-effort housekeeping such as removing files, which
+        needs neither a database session nor progress reporting.
+        """
+        app = current_app._get_current_object()
+
+        def run():
+            try:
+                target(*args)
+            except Exception:
+                app.logger.exception("Deferred task %s failed", target.__name__)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _run(app, job_id, target, args):
+        with app.app_context():
+            job = db.session.get(BackgroundJob, job_id)
+            job.status = "running"
+            db.session.commit()
+            try:
+                target(job, *args)
+                job.status = "completed"
+                job.finished_at = datetime.utcnow()
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                app.logger.exception("Background job %s failed", job_id)
+                job = db.session.get(BackgroundJob, job_id)
+                job.status = "failed"
+                job.error = str(e)
+                job.finished_at = datetime.utcnow()
+                db.session.commit()
+            finally:
+                db.session.remove()
+
+    @staticmethod
+    def to_dict(job):
+        return {
+            "id": job.id,
+            "job_type": job.job_type,
+            "status": job.status,
+            "total": job.total,
+            "processed": job.processed,
+            "error": job.error,
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        }
+
+
+def fan_out_video_job(job, video_id, level_id):
+    """Background target creating progress rows for a newly added video"""
+    batch_size = current_app.config.get("PROGRESS_FANOUT_BATCH_SIZE", 5000)
+    for covered in ProgressProvisioner.fan_out_video_in_batches(
+        video_id, level_id, batch_size
+    ):
+        job.processed += covered
+        db.session.commit()
+
+    # Responses cached while the fan-out was running lack the new rows
+    CatalogCache.bump_version()
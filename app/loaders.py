@@ -0,0 +1,193 @@
+from app import db
+from app.models import (
+    ExamResult,
+    Question,
+    UserLevel,
+    UserVideoProgress,
+    UserQuestionAnswer,
+    Video,
+)
+
+
+class ProgressLoader:
+    """Helper class for loading user progress data in bulk.
+
+    Every method issues a single query regardless of how many ids it is
+    given, and returns plain dictionaries keyed by id so routes can assemble
+    nested responses in memory instead of querying per level/video/question.
+    The Level -> Video -> Question tree itself comes from ``CatalogCache``.
+    """
+
+    @staticmethod
+    def load_user_levels(user_id, level_ids):
+        """Return {level_id: UserLevel} for the levels the user owns"""
+        if not level_ids:
+            return {}
+
+        user_levels = UserLevel.query.filter(
+            UserLevel.user_id == user_id, UserLevel.level_id.in_(level_ids)
+        ).all()
+        return {user_level.level_id: user_level for user_level in user_levels}
+
+    @staticmethod
+    def load_video_progress(user_level_ids):
+        """Return {(user_level_id, video_id): UserVideoProgress}"""
+        if not user_level_ids:
+            return {}
+
+        progress_rows = UserVideoProgress.query.filter(
+            UserVideoProgress.user_level_id.in_(user_level_ids)
+        ).all()
+        return {
+            (progress.user_level_id, progress.video_id): progress
+            for progress in progress_rows
+        }
+
+    @staticmethod
+    def load_answers(user_id, question_ids):
+        """Return {question_id: UserQuestionAnswer} for the given user"""
+        if not question_ids:
+            return {}
+
+        answers = UserQuestionAnswer.query.filter(
+            UserQuestionAnswer.user_id == user_id,
+            UserQuestionAnswer.question_id.in_(question_ids),
+        ).all()
+        return {answer.question_id: answer for answer in answers}
+
+    @staticmethod
+    def load_user_counts(level_ids):
+        """Return {level_id: number of users owning the level}"""
+        if not level_ids:
+            return {}
+
+        rows = (
+            db.session.query(UserLevel.level_id, db.func.count(UserLevel.id))
+            .filter(UserLevel.level_id.in_(level_ids))
+            .group_by(UserLevel.level_id)
+            .all()
+        )
+        counts = {level_id: 0 for level_id in level_ids}
+        counts.update({level_id: count for level_id, count in rows})
+        return counts
+
+    @staticmethod
+    def load_progress_by_user_level(user_level_ids):
+        """Return {user_level_id: [UserVideoProgress, ...]} in insertion order"""
+        progress_by_user_level = {user_level_id: [] for user_level_id in user_level_ids}
+        if not user_level_ids:
+            return progress_by_user_level
+
+        progress_rows = (
+            UserVideoProgress.query.filter(
+                UserVideoProgress.user_level_id.in_(user_level_ids)
+            )
+            .order_by(UserVideoProgress.id)
+            .all()
+        )
+        for progress in progress_rows:
+            progress_by_user_level[progress.user_level_id].append(progress)
+        return progress_by_user_level
+
+    @staticmethod
+    def load_exam_results(user_id, level_ids):
+        """Return {level_id: [ExamResult, ...]} for the given user"""
+        exams_by_level = {level_id: [] for level_id in level_ids}
+        if not level_ids:
+            return exams_by_level
+
+        exams = (
+            ExamResult.query.filter(
+                ExamResult.user_id == user_id, ExamResult.level_id.in_(level_ids)
+            )
+            .order_by(ExamResult.id)
+            .all()
+        )
+        for exam in exams:
+            exams_by_level[exam.level_id].append(exam)
+        return exams_by_level
+
+    @staticmethod
+    def load_progress_counts(video_ids):
+        """Return {video_id: number of progress rows for the video}"""
+        if not video_ids:
+            return {}
+
+        rows = (
+            db.session.query(
+                UserVideoProgress.video_id, db.func.count(UserVideoProgress.id)
+            )
+            .filter(UserVideoProgress.video_id.in_(video_ids))
+            .group_by(UserVideoProgress.video_id)
+            .all()
+        )
+        counts = {video_id: 0 for video_id in video_ids}
+        counts.update({video_id: count for video_id, count in rows})
+        return counts
+
+    @staticmethod
+    def load_answer_counts(question_ids):
+        """Return {question_id: number of answers submitted for the question}"""
+        if not question_ids:
+            return {}
+
+        rows = (
+            db.session.query(
+                UserQuestionAnswer.question_id, db.func.count(UserQuestionAnswer.id)
+            )
+            .filter(UserQuestionAnswer.question_id.in_(question_ids))
+            .group_by(UserQuestionAnswer.question_id)
+            .all()
+        )
+        counts = {question_id: 0 for question_id in question_ids}
+        counts.update({question_id: count for question_id, count in rows})
+        return counts
+
+    @staticmethod
+    def load_level_counts(user_ids):
+        """Return {user_id: number of levels the user owns}"""
+        if not user_ids:
+            return {}
+
+        rows = (
+            db.session.query(UserLevel.user_id, db.func.count(UserLevel.id))
+            .filter(UserLevel.user_id.in_(user_ids))
+            .group_by(UserLevel.user_id)
+            .all()
+        )
+        counts = {user_id: 0 for user_id in user_ids}
+        counts.update({user_id: count for user_id, count in rows})
+        return counts
+
+    @staticmethod
+    def load_answer_entitlements(user_id, question_ids):
+        """Return {question_id: row} describing whether the user may answer.
+
+        Each row has ``question`` plus ``user_level_id`` (None if the user does
+        not own the question's level) and ``is_opened`` (None if there is no
+        progress row for the question's video). Unknown questions are absent.
+        """
+        if not question_ids:
+            return {}
+
+        rows = (
+            db.session.query(
+                Question,
+                UserLevel.id.label("user_level_id"),
+                UserVideoProgress.is_opened.label("is_opened"),
+            )
+            .join(Video, Video.id == Question.video_id)
+            .outerjoin(
+                UserLevel,
+                (UserLevel.level_id == Video.level_id)
+                & (UserLevel.user_id == user_id),
+            )
+            .outerjoin(
+                UserVideoProgress,
+                (UserVideoProgress.user_level_id == UserLevel.id)
+                & (UserVideoProgress.video_id == Video.id),
+            )
+            .filter(Question.id.in_(question_ids))
+            .all()
+        )
+        return {row.Question.id: row for row in rows}
@@ -48,6 +48,8 @@ class LocalizationHelper:
             'question_deleted_successfully': 'Question deleted successfully',
             'answer_not_found': 'Answer not found',
             'answer_submitted_successfully': 'Answer submitted successfully',
+            'answers_submitted_successfully': 'Answers submitted successfully',
+            'too_many_answers': 'At most {max} answers can be submitted at once',
             
             # Exam management
             'exam_not_available': 'Final exam is not available yet. Please complete all videos first',
@@ -59,6 +61,7 @@ class LocalizationHelper:
             'user_created_successfully': 'User created successfully',
             'user_updated_successfully': 'User updated successfully',
             'user_deleted_successfully': 'User deleted successfully',
+            'too_many_users': 'At most {max} users can be requested at once',
             'password_reset_successfully': 'Password reset successfully',
             'level_assigned_successfully': 'Level assigned successfully',
             'level_purchased_successfully': 'Level purchased successfully',
@@ -67,6 +70,10 @@ class LocalizationHelper:
             'welcome_video_set': 'Welcome video set successfully',
             'welcome_video_not_found': 'No welcome video has been set',
             
+            # Background jobs
+            'job_not_found': 'Job not found',
+            'job_retrieved_successfully': 'Job retrieved successfully',
+            
             # General messages
             'operation_successful': 'Operation completed successfully',
             'operation_failed': 'Operation failed. Please try again',
@@ -77,6 +84,8 @@ class LocalizationHelper:
             'forbidden': 'This action is forbidden',
             'validation_error': 'Please check your input data',
             'database_error': 'Database operation failed. Please try again',
+            'server_busy': 'The server is busy. Please try again shortly',
+            'rendering_failed': 'The file could not be generated. Please try again',
         },
         'ar': {
             # Authentication messages
@@ -124,6 +133,8 @@ class LocalizationHelper:
             'question_deleted_successfully': 'تم حذف السؤال بنجاح',
             'answer_not_found': 'الإجابة غير موجودة',
             'answer_submitted_successfully': 'تم إرسال الإجابة بنجاح',
+            'answers_submitted_successfully': 'تم إرسال الإجابات بنجاح',
+            'too_many_answers': 'يمكن إرسال {max} إجابة كحد أقصى في المرة الواحدة',
             
             # Exam management
             'exam_not_available': 'الامتحان النهائي غير متاح بعد. يرجى إكمال جميع الفيديوهات أولاً',
@@ -135,6 +146,7 @@ class LocalizationHelper:
             'user_created_successfully': 'تم إنشاء المستخدم بنجاح',
             'user_updated_successfully': 'تم تحديث المستخدم بنجاح',
             'user_deleted_successfully': 'تم حذف المستخدم بنجاح',
+            'too_many_users': 'يمكن طلب {max} مستخدم كحد أقصى في المرة الواحدة',
             'password_reset_successfully': 'تم إعادة تعيين كلمة المرور بنجاح',
             'level_assigned_successfully': 'تم تعيين المستوى بنجاح',
             'level_purchased_successfully': 'تم شراء المستوى بنجاح',
@@ -143,6 +155,10 @@ class LocalizationHelper:
             'welcome_video_set': 'تم تعيين فيديو الترحيب بنجاح',
             'welcome_video_not_found': 'لم يتم تعيين فيديو ترحيب',
             
+            # Background jobs
+            'job_not_found': 'المهمة غير موجودة',
+            'job_retrieved_successfully': 'تم جلب المهمة بنجاح',
+            
             # General messages
             'operation_successful': 'تمت العملية بنجاح',
             'operation_failed': 'فشلت العملية. يرجى المحاولة مرة أخرى',
@@ -153,6 +169,8 @@ class LocalizationHelper:
             'forbidden': 'هذا الإجراء محظور',
             'validation_error': 'يرجى التحقق من البيانات المدخلة',
             'database_error': 'فشل في عملية قاعدة البيانات. يرجى المحاولة مرة أخرى',
+            'server_busy': 'الخادم مشغول. يرجى المحاولة مرة أخرى بعد قليل',
+            'rendering_failed': 'تعذر إنشاء الملف. يرجى المحاولة مرة أخرى',
         }
     }
     
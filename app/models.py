@@ -1,4 +1,5 @@
 from datetime import datetime
+from sqlalchemy import DDL, event
 from app import db
 
 class WelcomeVideo(db.Model):
@@ -45,6 +46,10 @@ class Video(db.Model):
     order = db.Column(db.Integer, nullable=False, default=1)  # NEW FIELD for ordering
     questions = db.relationship('Question', backref='video', lazy=True, cascade='all, delete-orphan')
 
+    __table_args__ = (
+        db.Index('ix_video_level_order', 'level_id', 'order'),
+    )
+
     def _repr_(self):
         return f'Video(\'{self.name}\', \'{self.youtube_link}\')'
 
@@ -58,6 +63,10 @@ class Question(db.Model):
     # Relationship with user answers
     user_answers = db.relationship('UserQuestionAnswer', backref='question', lazy=True, cascade='all, delete-orphan')
 
+    __table_args__ = (
+        db.Index('ix_question_video_order', 'video_id', 'order'),
+    )
+
     def _repr_(self):
         return f'Question(Video: {self.video_id}, Order: {self.order})'
 
@@ -70,8 +79,13 @@ class UserLevel(db.Model):
     initial_exam_score = db.Column(db.Float, nullable=True)
     final_exam_score = db.Column(db.Float, nullable=True)
     score_difference = db.Column(db.Float, nullable=True)
+    completed_videos_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # NEW FIELD kept in sync by complete_video
     videos_progress = db.relationship('UserVideoProgress', backref='user_level', lazy=True)
 
+    __table_args__ = (
+        db.Index('ix_user_level_user_level', 'user_id', 'level_id'),
+    )
+
     def _repr_(self):
         return f'UserLevel(User: {self.user_id}, Level: {self.level_id})'
 
@@ -83,8 +97,9 @@ class UserVideoProgress(db.Model):
     is_completed = db.Column(db.Boolean, default=False)
 
     # Add unique constraint on user_level_id and video_id
-    _table_args_ = (
+    __table_args__ = (
         db.UniqueConstraint('user_level_id', 'video_id', name='uq_user_level_video'),
+        db.Index('ix_user_video_progress_video', 'video_id'),  # Per-video counts on /admin/videos
     )
 
     def _repr_(self):
@@ -94,13 +109,15 @@ class UserQuestionAnswer(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     question_id = db.Column(db.Integer, db.ForeignKey('question.id'), nullable=False)
-    speechace_response = db.Column(db.Text, nullable=True) 
+    # Legacy uncompressed payload; new answers keep it in UserQuestionAnswerPayload
+    speechace_response = db.deferred(db.Column(db.Text, nullable=True))
     percentage = db.Column(db.Float, nullable=False, default=0.0)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Add unique constraint on user_id and question_id
-    _table_args_ = (
+    __table_args__ = (
         db.UniqueConstraint('user_id', 'question_id', name='uq_user_question'),
+        db.Index('ix_user_question_answer_question', 'question_id', 'id'),  # Per-question counts on /admin/questions
     )
 
     # Relationships
@@ -113,11 +130,139 @@ class ExamResult(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     level_id = db.Column(db.Integer, db.ForeignKey('level.id'), nullable=False)
-    speechace_response = db.Column(db.Text, nullable=True)
+    # Legacy uncompressed payload; new results keep it in ExamResultPayload
+    speechace_response = db.deferred(db.Column(db.Text, nullable=True))
     percentage = db.Column(db.Float, nullable=False)
     type = db.Column(db.String(20), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
-    
+
+    __table_args__ = (
+        db.Index('ix_exam_result_user_level', 'user_id', 'level_id'),
+    )
+
+    def _repr_(self):
+        return f'ExamResult(User: {self.user_id}, Level: {self.level_id}, Type: {self.type}, Score: {self.percentage})'
+
+class UserQuestionAnswerPayload(db.Model):
+    # Compressed raw SpeechAce response of an answer, see app/payloads.py
+    answer_id = db.Column(db.Integer, db.ForeignKey('user_question_answer.id'), primary_key=True)
+    codec = db.Column(db.String(10), nullable=False)
+    data = db.Column(db.LargeBinary, nullable=False)
+
+    def _repr_(self):
+        return f'UserQuestionAnswerPayload(Answer: {self.answer_id}, Codec: {self.codec})'
+
+
+class ExamResultPayload(db.Model):
+    # Compressed raw SpeechAce response of an exam result, see app/payloads.py
+    exam_result_id = db.Column(db.Integer, db.ForeignKey('exam_result.id'), primary_key=True)
+    codec = db.Column(db.String(10), nullable=False)
+    data = db.Column(db.LargeBinary, nullable=False)
+
+    def _repr_(self):
+        return f'ExamResultPayload(ExamResult: {self.exam_result_id}, Codec: {self.codec})'
+
+
+class PlatformStatistics(db.Model):
+    # Single row (id=1) of platform totals, kept in sync by app/statistics.py
+    id = db.Column(db.Integer, primary_key=True)
+    total_users = db.Column(db.Integer, nullable=False, default=0)  # Clients only
+    total_levels = db.Column(db.Integer, nullable=False, default=0)
+    total_purchases = db.Column(db.Integer, nullable=False, default=0)
+    completed_levels = db.Column(db.Integer, nullable=False, default=0)
+    # Bumped whenever enrollments are added or removed, for admin ETags
+    enrollment_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    def _repr_(self):
+        return f'PlatformStatistics(Users: {self.total_users}, Purchases: {self.total_purchases})'
+
+
+class LevelStatistics(db.Model):
+    # Per-level purchase and completion counts, kept in sync by app/statistics.py
+    level_id = db.Column(db.Integer, db.ForeignKey('level.id'), primary_key=True)
+    purchases = db.Column(db.Integer, nullable=False, default=0)
+    completions = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('ix_level_statistics_purchases', 'purchases'),
+    )
+
+    def _repr_(self):
+        return f'LevelStatistics(Level: {self.level_id}, Purchases: {self.purchases})'
+
+
+@event.listens_for(db.metadata, 'after_create')
+def _seed_statistics(target, connection, tables=(), **kw):
+    # Counter tables created by db.create_all() start out matching the data
+    # already there; migrated databases are seeded by revision e4d91b07a3c6
+    if PlatformStatistics.__table__ in tables:
+        def count(*criteria):
+            return db.select(db.func.count()).select_from(UserLevel).where(*criteria).scalar_subquery()
+
+        connection.execute(
+            db.insert(PlatformStatistics).from_select(
+                ['id', 'total_users', 'total_levels', 'total_purchases', 'completed_levels'],
+                db.select(
+                    db.literal(1),
+                    db.select(db.func.count(User.id)).where(User.role == 'client').scalar_subquery(),
+                    db.select(db.func.count(Level.id)).scalar_subquery(),
+                    count(),
+                    count(UserLevel.is_completed.is_(True)),
+                ),
+            )
+        )
+    if LevelStatistics.__table__ in tables:
+        connection.execute(
+            db.insert(LevelStatistics).from_select(
+                ['level_id', 'purchases', 'completions'],
+                db.select(
+                    Level.id,
+                    db.func.count(UserLevel.id),
+                    db.func.count(UserLevel.id).filter(UserLevel.is_completed.is_(True)),
+                )
+                .outerjoin(UserLevel, UserLevel.level_id == Level.id)
+                .group_by(Level.id),
+            )
+        )
+
+
+class CatalogVersion(db.Model):
+    # Single row (id=1) bumped by every admin change to levels, videos or questions
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def _repr_(self):
+        return f'CatalogVersion({self.version})'
+
+
+# Databases built by db.create_all() get the single row with the table;
+# migrated databases get it from revision a5d3f8c2e917
+event.listen(
+    CatalogVersion.__table__,
+    'after_create',
+    DDL('INSERT INTO catalog_version (id, version) VALUES (1, 0)'),
+)
+
+
+class UserProgressVersion(db.Model):
+    # Bumped whenever anything in the user's personalized progress view changes
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def _repr_(self):
+        return f'UserProgressVersion(User: {self.user_id}, Version: {self.version})'
+
+
+class BackgroundJob(db.Model):
+    # Long-running admin work (e.g. progress fan-out) executed outside the request
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, completed, failed
+    total = db.Column(db.Integer, nullable=False, default=0)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime)
 
     def _repr_(self):
-        return f'ExamResult(User: {self.user_id}, Level: {self.level_id}, Type: {self.type}, Score: {self.percentage})'
\ No newline at end of file
+        return f'BackgroundJob({self.job_type}, {self.status}, {self.processed}/{self.total})'
@@ -0,0 +1,87 @@
+import base64
+import binascii
+import json
+
+from flask import request
+from sqlalchemy import tuple_
+
+
+class KeysetPaginator:
+    """Helper class for cursor (keyset) pagination of admin listings.
+
+    Pages are selected with ``WHERE (key columns) > (cursor values)`` on
+    indexed columns instead of OFFSET, so every page costs the same no matter
+    how deep the client has scrolled. Cursors are opaque to clients.
+    """
+
+    DEFAULT_LIMIT = 100
+    MAX_LIMIT = 500
+
+    @staticmethod
+    def encode_cursor(values):
+        """Encode the key values of the last row of a page as a cursor"""
+        raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor, key_count):
+        """Decode a cursor, raising ValueError if it was tampered with"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, json.JSONDecodeError):
+            raise ValueError("invalid cursor")
+        if not isinstance(values, list) or len(values) != key_count:
+            raise ValueError("invalid cursor")
+        if not all(isinstance(value, int) for value in values):
+            raise ValueError("invalid cursor")
+        return values
+
+    @classmethod
+    def get_limit(cls):
+        """Read the page size from the request, raising ValueError if invalid"""
+        raw_limit = request.args.get("limit")
+        if raw_limit is None:
+            return cls.DEFAULT_LIMIT
+        # Parsed here rather than with type=int, which silently falls back
+        # to the default for values such as "abc"
+        limit = int(raw_limit)
+        if limit < 1:
+            raise ValueError("invalid limit")
+        return min(limit, cls.MAX_LIMIT)
+
+    @classmethod
+    def paginate(cls, query, key_columns, key_func):
+        """Return one page of ``query`` ordered by ``key_columns``.
+
+        ``key_func`` maps a row to the values of ``key_columns``. Reads the
+        ``limit``, ``after`` and ``include_total`` query parameters and
+        returns ``(items, pagination)``. Raises ValueError on bad parameters.
+        """
+        limit = cls.get_limit()
+        after = request.args.get("after")
+        include_total = request.args.get("include_total", "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+
+        page_query = query
+        if after:
+            values = cls.decode_cursor(after, len(key_columns))
+            page_query = page_query.filter(tuple_(*key_columns) > tuple_(*values))
+
+        # Fetch one extra row to know whether another page follows
+        items = page_query.order_by(*key_columns).limit(limit + 1).all()
+        has_more = len(items) > limit
+        items = items[:limit]
+
+        pagination = {
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": cls.encode_cursor(key_func(items[-1])) if has_more else None,
+        }
+        if include_total:
+            pagination["total_count"] = query.order_by(None).count()
+
+        return items, pagination
@@ -0,0 +1,191 @@
+import json
+import zlib
+
+from app import db
+from app.bulk import BulkWriter
+from app.encoding import RawJSON
+from app.models import (
+    ExamResult,
+    ExamResultPayload,
+    UserQuestionAnswer,
+    UserQuestionAnswerPayload,
+)
+
+try:
+    import zstandard
+except ImportError:  # zlib from the standard library is used instead
+    zstandard = None
+
+
+class PayloadStore:
+    """Helper class for storing raw SpeechAce responses compressed.
+
+    The hot answer and exam rows only keep the extracted score; the full
+    response lives in a side table keyed by the row id and is only read and
+    decompressed when a client asks for it, as ``RawJSON`` so it is never
+    parsed on the way to the client. Rows written before the side tables
+    existed still carry the payload in their legacy ``speechace_response``
+    column until ``flask backfill-payloads`` moves it.
+    """
+
+    CODEC = "zstd" if zstandard is not None else "zlib"
+
+    @staticmethod
+    def encode(payload):
+        """Return the compact JSON text of a payload, passing RawJSON through"""
+        if isinstance(payload, RawJSON):
+            return payload.text
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def compress(cls, text):
+        """Return (codec, bytes) for a payload's JSON text"""
+        raw = text.encode("utf-8")
+        if cls.CODEC == "zstd":
+            return "zstd", zstandard.ZstdCompressor(level=3).compress(raw)
+        return "zlib", zlib.compress(raw, 6)
+
+    @staticmethod
+    def decompress(codec, data):
+        """Inverse of ``compress``, returning the payload as RawJSON.
+
+        The JSON text is never parsed; the response encoder splices it in.
+        """
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd payloads")
+            raw = zstandard.ZstdDecompressor().decompress(data)
+        elif codec == "zlib":
+            raw = zlib.decompress(data)
+        else:
+            raise ValueError(f"Unknown payload codec: {codec}")
+        return RawJSON(raw.decode("utf-8"))
+
+    @classmethod
+    def decode(cls, codec, data, legacy=None):
+        """Payload of one row from its side-table columns or legacy column"""
+        if data is not None:
+            return cls.decompress(codec, data)
+        if legacy:
+            return RawJSON(legacy)
+        return {}
+
+    @staticmethod
+    def _rows(key, payloads):
+        rows = []
+        for row_id, payload in payloads.items():
+            codec, data = PayloadStore.compress(PayloadStore.encode(payload))
+            rows.append({key: row_id, "codec": codec, "data": data})
+        return rows
+
+    @staticmethod
+    def save_answer_payloads(payloads):
+        """Store {answer_id: payload}, replacing earlier payloads"""
+        BulkWriter.upsert(
+            UserQuestionAnswerPayload,
+            PayloadStore._rows("answer_id", payloads),
+            index_elements=["answer_id"],
+            update_columns=["codec", "data"],
+            returning=False,
+        )
+
+    @staticmethod
+    def save_exam_payload(exam_result_id, payload):
+        codec, data = PayloadStore.compress(PayloadStore.encode(payload))
+        db.session.add(
+            ExamResultPayload(exam_result_id=exam_result_id, codec=codec, data=data)
+        )
+
+    @staticmethod
+    def _load(payload_model, key_column, legacy_model, row_ids):
+        if not row_ids:
+            return {}
+
+        payloads = {
+            row_id: PayloadStore.decompress(codec, data)
+            for row_id, codec, data in db.session.query(
+                key_column, payload_model.codec, payload_model.data
+            ).filter(key_column.in_(row_ids))
+        }
+        missing = [row_id for row_id in row_ids if row_id not in payloads]
+        if missing:
+            legacy_rows = db.session.query(
+                legacy_model.id, legacy_model.speechace_response
+            ).filter(
+                legacy_model.id.in_(missing),
+                legacy_model.speechace_response.isnot(None),
+            )
+            payloads.update(
+                {row_id: RawJSON(legacy) for row_id, legacy in legacy_rows}
+            )
+        return payloads
+
+    @staticmethod
+    def load_answer_payloads(answer_ids):
+        """Return {answer_id: payload} for answers that have one"""
+        return PayloadStore._load(
+            UserQuestionAnswerPayload,
+            UserQuestionAnswerPayload.answer_id,
+            UserQuestionAnswer,
+            list(answer_ids),
+        )
+
+    @staticmethod
+    def load_exam_payloads(exam_result_ids):
+        """Return {exam_result_id: payload} for exam results that have one"""
+        return PayloadStore._load(
+            ExamResultPayload,
+            ExamResultPayload.exam_result_id,
+            ExamResult,
+            list(exam_result_ids),
+        )
+
+    @staticmethod
+    def _backfill_batch(payload_model, key, legacy_model, batch_size, after_id):
+        rows = (
+            db.session.query(legacy_model.id, legacy_model.speechace_response)
+            .filter(
+                legacy_model.id > after_id,
+                legacy_model.speechace_response.isnot(None),
+            )
+            .order_by(legacy_model.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return None
+
+        # Rows that already have a side-table payload were resubmitted later,
+        # so that payload is newer and must be kept
+        BulkWriter.insert_ignore(
+            payload_model,
+            PayloadStore._rows(key, {row_id: RawJSON(legacy) for row_id, legacy in rows}),
+            index_elements=[key],
+        )
+        row_ids = [row_id for row_id, _ in rows]
+        legacy_model.query.filter(legacy_model.id.in_(row_ids)).update(
+            {legacy_model.speechace_response: None}, synchronize_session=False
+        )
+        return row_ids[-1], len(rows)
+
+    @staticmethod
+    def backfill(batch_size):
+        """Move legacy payloads into the side tables, one committed batch at a time.
+
+        Yields (table name, rows moved so far) after every batch.
+        """
+        for payload_model, key, legacy_model in (
+            (UserQuestionAnswerPayload, "answer_id", UserQuestionAnswer),
+            (ExamResultPayload, "exam_result_id", ExamResult),
+        ):
+            after_id, moved = 0, 0
+            while True:
+                result = PayloadStore._backfill_batch(
+                    payload_model, key, legacy_model, batch_size, after_id
+                )
+                if result is None:
+                    break
+                after_id, count = result
+                db.session.commit()
+                moved += count
+                yield legacy_model.__tablename__, moved
@@ -0,0 +1,203 @@
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.bulk import BulkWriter
+from app.models import UserLevel, UserProgressVersion, UserVideoProgress
+
+
+class ProgressVersions:
+    """Helper class for tracking when a user's progress view changes.
+
+    Every route that changes what a user sees in their personalized catalog
+    (purchases, answers, exams, completed videos) calls ``bump`` in the same
+    transaction, so the version can be used to validate cached responses.
+    """
+
+    @staticmethod
+    def get(user_id):
+        """Return the current progress version of a user"""
+        version = (
+            db.session.query(UserProgressVersion.version)
+            .filter_by(user_id=user_id)
+            .scalar()
+        )
+        return version or 0
+
+    @staticmethod
+    def bump(user_id):
+        """Advance the user's progress version in the current transaction"""
+        updated = UserProgressVersion.query.filter_by(user_id=user_id).update(
+            {UserProgressVersion.version: UserProgressVersion.version + 1},
+            synchronize_session=False,
+        )
+        if updated:
+            return
+
+        try:
+            with db.session.begin_nested():
+                db.session.add(UserProgressVersion(user_id=user_id, version=1))
+        except IntegrityError:
+            # A concurrent request created the row first
+            UserProgressVersion.query.filter_by(user_id=user_id).update(
+                {UserProgressVersion.version: UserProgressVersion.version + 1},
+                synchronize_session=False,
+            )
+
+
+class ProgressCounters:
+    """Helper class for maintaining ``UserLevel.completed_videos_count``.
+
+    All updates are single SQL statements that increment in the database, so
+    concurrent completions of different videos never lose an update.
+    """
+
+    @staticmethod
+    def mark_completed(progress):
+        """Mark a progress row completed, bumping its level's counter once.
+
+        Returns the level's new completed count, or None if the video had
+        already been completed.
+        """
+        updated = UserVideoProgress.query.filter_by(
+            id=progress.id, is_completed=False
+        ).update({UserVideoProgress.is_completed: True}, synchronize_session=False)
+        if not updated:
+            return None
+
+        stmt = (
+            db.update(UserLevel)
+            .where(UserLevel.id == progress.user_level_id)
+            .values(completed_videos_count=UserLevel.completed_videos_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if db.session.get_bind().dialect.update_returning:
+            return db.session.execute(
+                stmt.returning(UserLevel.completed_videos_count)
+            ).scalar()
+
+        # Without UPDATE ... RETURNING, read the counter back in the same
+        # transaction, whose update keeps concurrent increments out until commit
+        db.session.execute(stmt)
+        return (
+            db.session.query(UserLevel.completed_videos_count)
+            .filter_by(id=progress.user_level_id)
+            .scalar()
+        )
+
+    @staticmethod
+    def discount_video(video_id):
+        """Remove a video's completions from the counters before it is deleted"""
+        completed_user_levels = db.session.query(UserVideoProgress.user_level_id).filter_by(
+            video_id=video_id, is_completed=True
+        )
+        UserLevel.query.filter(UserLevel.id.in_(completed_user_levels)).update(
+            {UserLevel.completed_videos_count: UserLevel.completed_videos_count - 1},
+            synchronize_session=False,
+        )
+
+    @staticmethod
+    def recount():
+        """Recompute every counter from the progress rows, returning the row count"""
+        completed = (
+            db.select(db.func.count(UserVideoProgress.id))
+            .where(
+                UserVideoProgress.user_level_id == UserLevel.id,
+                UserVideoProgress.is_completed.is_(True),
+            )
+            .scalar_subquery()
+        )
+        return UserLevel.query.update(
+            {UserLevel.completed_videos_count: completed}, synchronize_session=False
+        )
+
+
+class ProgressProvisioner:
+    """Helper class for creating the progress rows of a newly owned level"""
+
+    @staticmethod
+    def provision(user_level_id, video_ids):
+        """Create one progress row per video with the first video opened.
+
+        ``video_ids`` must be in unlock order. All rows are written with a
+        single conflict-ignoring INSERT, so provisioning is idempotent.
+        """
+        BulkWriter.insert_ignore(
+            UserVideoProgress,
+            [
+                {
+                    "user_level_id": user_level_id,
+                    "video_id": video_id,
+                    "is_opened": i == 0,
+                    "is_completed": False,
+                }
+                for i, video_id in enumerate(video_ids)
+            ],
+            index_elements=["user_level_id", "video_id"],
+        )
+
+    @staticmethod
+    def _enrollment_filter(level_id, after_id=None, up_to_id=None):
+        criteria = [UserLevel.level_id == level_id]
+        if after_id is not None:
+            criteria.append(UserLevel.id > after_id)
+        if up_to_id is not None:
+            criteria.append(UserLevel.id <= up_to_id)
+        return criteria
+
+    @staticmethod
+    def fan_out_video(video_id, level_id, after_id=None, up_to_id=None):
+        """Give every owner of a level a progress row for a newly added video.
+
+        Runs as one INSERT ... SELECT over the level's enrollments, optionally
+        limited to the UserLevel id range ``(after_id, up_to_id]``. The video
+        is opened for users who have no unfinished video left. Enrollments
+        that already have a row are skipped, so the fan-out can be re-run.
+        Returns the number of rows inserted.
+        """
+        unfinished = db.exists().where(
+            UserVideoProgress.user_level_id == UserLevel.id,
+            UserVideoProgress.is_completed.is_(False),
+        )
+        already_provisioned = db.exists().where(
+            UserVideoProgress.user_level_id == UserLevel.id,
+            UserVideoProgress.video_id == video_id,
+        )
+        rows = db.select(
+            UserLevel.id,
+            db.literal(video_id),
+            ~unfinished,
+            db.false(),
+        ).where(
+            *ProgressProvisioner._enrollment_filter(level_id, after_id, up_to_id),
+            ~already_provisioned,
+        )
+        result = db.session.execute(
+            db.insert(UserVideoProgress).from_select(
+                ["user_level_id", "video_id", "is_opened", "is_completed"], rows
+            )
+        )
+        return result.rowcount
+
+    @staticmethod
+    def fan_out_video_in_batches(video_id, level_id, batch_size):
+        """Run ``fan_out_video`` over consecutive UserLevel id ranges.
+
+        Yields the number of enrollments covered after each batch so the
+        caller can commit and report progress between batches.
+        """
+        last_id = None
+        while True:
+            batch_ids = [
+                user_level_id
+                for (user_level_id,) in db.session.query(UserLevel.id)
+                .filter(*ProgressProvisioner._enrollment_filter(level_id, last_id))
+                .order_by(UserLevel.id)
+                .limit(batch_size)
+            ]
+            if not batch_ids:
+                return
+            ProgressProvisioner.fan_out_video(
+                video_id, level_id, after_id=last_id, up_to_id=batch_ids[-1]
+            )
+            last_id = batch_ids[-1]
+            yield len(batch_ids)
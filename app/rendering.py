@@ -0,0 +1,82 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from flask import current_app
+
+
+class RenderPool:
+    """Helper class for running CPU-bound rendering in worker processes.
+
+    Each app process owns one small pool of spawned worker processes, so
+    laying out PDFs or drawing charts neither holds the GIL of the request
+    threads nor grows with the number of requests. At most
+    ``RENDER_POOL_MAX_PENDING`` renders may be queued or running; callers
+    beyond that are turned away instead of piling up. Targets must be
+    module-level functions taking and returning plain, picklable data.
+    """
+
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_state(cls):
+        state = current_app.extensions.setdefault("render_pool", {})
+        if "executor" not in state:
+            with cls._lock:
+                if "slots" not in state:
+                    state["slots"] = threading.BoundedSemaphore(
+                        current_app.config["RENDER_POOL_MAX_PENDING"]
+                    )
+                if "executor" not in state:
+                    # Spawned workers do not inherit the app's threads, locks
+                    # or database connections the way forked ones would
+                    state["executor"] = ProcessPoolExecutor(
+                        max_workers=current_app.config["RENDER_POOL_WORKERS"],
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return state
+
+    @classmethod
+    def run(cls, target, *args):
+        """Return ``target(*args)`` computed in the pool, or None if it is full.
+
+        Raises whatever ``target`` raised, or ``TimeoutError`` after
+        ``RENDER_TIMEOUT`` seconds.
+        """
+        state = cls._get_state()
+        if not state["slots"].acquire(blocking=False):
+            return None
+        executor = state["executor"]
+        try:
+            future = executor.submit(target, *args)
+            try:
+                return future.result(timeout=current_app.config["RENDER_TIMEOUT"])
+            finally:
+                future.cancel()  # Drops a render that timed out while still queued
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool for
+            # the next render instead of failing every one from now on
+            with cls._lock:
+                if state.get("executor") is executor:
+                    del state["executor"]
+            executor.shutdown(wait=False)
+            raise
+        finally:
+            state["slots"].release()
+
+
+def write_file_atomically(path, data):
+    """Write bytes to ``path`` so that readers never see a partial file"""
+    folder = os.path.dirname(path)
+    os.makedirs(folder, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
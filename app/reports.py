@@ -0,0 +1,239 @@
+import glob
+import hashlib
+import json
+import os
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from flask import current_app
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.platypus import (
+    KeepTogether,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from app.rendering import RenderPool, write_file_atomically
+
+
+# Bump when the PDF layout changes so that previously cached files are unused
+REPORT_LAYOUT_VERSION = 1
+
+INITIAL_COLOR = colors.HexColor("#f39c12")
+FINAL_COLOR = colors.HexColor("#27ae60")
+HEADER_COLOR = colors.HexColor("#2c3e50")
+
+
+def _score(value):
+    return "-" if value is None else f"{value:.1f}%"
+
+
+def _yes_no(value):
+    return "Yes" if value else "No"
+
+
+def _table(rows, col_widths):
+    table = Table(rows, colWidths=col_widths, repeatRows=1)
+    table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), HEADER_COLOR),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 9),
+                ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ]
+        )
+    )
+    return table
+
+
+def _exam_chart(levels):
+    """Bar chart of initial versus final exam score per level"""
+    drawing = Drawing(6.5 * inch, 2.6 * inch)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 40, 40
+    chart.width, chart.height = 5.2 * inch, 1.8 * inch
+    chart.data = [
+        [level["initial_exam_score"] or 0 for level in levels],
+        [level["final_exam_score"] or 0 for level in levels],
+    ]
+    chart.categoryAxis.categoryNames = [f"L{level['level_number']}" for level in levels]
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = 100
+    chart.valueAxis.valueStep = 20
+    chart.bars[0].fillColor = INITIAL_COLOR
+    chart.bars[1].fillColor = FINAL_COLOR
+    drawing.add(chart)
+
+    legend = Legend()
+    legend.x, legend.y = 6.0 * inch, 2.4 * inch
+    legend.colorNamePairs = [(INITIAL_COLOR, "Initial"), (FINAL_COLOR, "Final")]
+    drawing.add(legend)
+    return drawing
+
+
+def render_report_pdf(report):
+    """Render a progress report, as built for ``/report``, into PDF bytes.
+
+    Runs in a ``RenderPool`` worker process, so it only gets plain data.
+    """
+    styles = getSampleStyleSheet()
+    user = report["user"]
+    levels = report["levels"]
+    story = [
+        Paragraph("Progress Report", styles["Title"]),
+        _table(
+            [
+                ["Name", "Email", "Phone"],
+                [user["name"], user["email"], user["phone"]],
+            ],
+            [2.2 * inch, 2.6 * inch, 1.7 * inch],
+        ),
+        Spacer(1, 0.25 * inch),
+    ]
+
+    if not levels:
+        story.append(Paragraph("No levels purchased yet.", styles["Normal"]))
+
+    else:
+        summary_rows = [
+            ["Level", "Completed", "Videos", "Initial", "Final", "Difference"]
+        ]
+        for level in levels:
+            completed_videos = sum(
+                1 for video in level["videos"] if video["is_completed"]
+            )
+            summary_rows.append(
+                [
+                    f"{level['level_number']}. {level['level_name']}",
+                    _yes_no(level["is_completed"]),
+                    f"{completed_videos}/{len(level['videos'])}",
+                    _score(level["initial_exam_score"]),
+                    _score(level["final_exam_score"]),
+                    _score(level["score_difference"]),
+                ]
+            )
+        story += [
+            Paragraph("Summary", styles["Heading2"]),
+            _table(
+                summary_rows,
+                [2.2 * inch, 0.8 * inch, 0.7 * inch, 0.9 * inch, 0.9 * inch, 1.0 * inch],
+            ),
+            Spacer(1, 0.2 * inch),
+            _exam_chart(levels),
+        ]
+
+        for level in levels:
+            video_rows = [["#", "Video", "Opened", "Completed", "Answered", "Avg. score"]]
+            for index, video in enumerate(level["videos"], start=1):
+                scores = [
+                    question["percentage"]
+                    for question in video["questions"]
+                    if question["percentage"] is not None
+                ]
+                video_rows.append(
+                    [
+                        index,
+                        video["video_name"],
+                        _yes_no(video["is_opened"]),
+                        _yes_no(video["is_completed"]),
+                        f"{len(scores)}/{len(video['questions'])}",
+                        _score(sum(scores) / len(scores) if scores else None),
+                    ]
+                )
+            # Paragraphs parse markup, so user-entered names are escaped
+            title = f"Level {level['level_number']}: {escape(level['level_name'])}"
+            section = [
+                Paragraph(title, styles["Heading2"]),
+                _table(
+                    video_rows,
+                    [0.4 * inch, 2.6 * inch, 0.8 * inch, 0.9 * inch, 0.9 * inch, 0.9 * inch],
+                ),
+            ]
+            if level["exams"]:
+                exam_rows = [["Exam", "Score", "Taken at"]]
+                for exam in level["exams"]:
+                    exam_rows.append(
+                        [
+                            exam["type"].capitalize(),
+                            _score(exam["percentage"]),
+                            exam["timestamp"][:16].replace("T", " "),
+                        ]
+                    )
+                section += [
+                    Spacer(1, 0.1 * inch),
+                    _table(exam_rows, [1.5 * inch, 1.2 * inch, 2.0 * inch]),
+                ]
+            story += [Spacer(1, 0.2 * inch), KeepTogether(section)]
+
+    buffer = BytesIO()
+    SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        title="Progress Report",
+        leftMargin=0.75 * inch,
+        rightMargin=0.75 * inch,
+    ).build(story)
+    return buffer.getvalue()
+
+
+class ReportCache:
+    """Helper class for serving rendered PDF reports from disk.
+
+    A PDF is cached under a key derived from everything it shows that can
+    change: the user's progress version, the catalog version and the user's
+    own details. Repeated downloads are then a plain file send, and only the
+    newest file of each user is kept.
+    """
+
+    @staticmethod
+    def get_key(user, progress_version, catalog_version):
+        parts = [
+            REPORT_LAYOUT_VERSION,
+            progress_version,
+            catalog_version,
+            [user.name, user.email, user.phone],
+        ]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def _path(user_id, key):
+        return os.path.join(
+            current_app.config["REPORT_CACHE_FOLDER"], f"report-{user_id}-{key}.pdf"
+        )
+
+    @staticmethod
+    def get_or_render(user_id, key, build_report):
+        """Return the path of the cached PDF, rendering it if needed.
+
+        ``build_report`` is only called on a cache miss. Returns None when
+        the render pool is saturated.
+        """
+        path = ReportCache._path(user_id, key)
+        if os.path.exists(path):
+            return path
+
+        pdf = RenderPool.run(render_report_pdf, build_report())
+        if pdf is None:
+            return None
+        write_file_atomically(path, pdf)
+
+        for stale_path in glob.glob(ReportCache._path(user_id, "*")):
+            if stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+        return path
@@ -1,4 +1,5 @@
 # === Imports: Built-in ===
+import hashlib
 import json
 import os
 import tempfile
@@ -16,14 +17,16 @@ import pandas as pd
 import seaborn as sns
 from flask import (
     Blueprint,
+    abort,
     request,
     jsonify,
     send_from_directory,
     current_app,
     make_response,
     send_file,
+    stream_with_context,
 )
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
 from reportlab.graphics import renderPDF
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.legends import Legend
@@ -48,16 +51,29 @@ from reportlab.platypus import (
     PageBreak,
 )
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
+from werkzeug.http import quote_etag
 from werkzeug.utils import secure_filename
 
 # === Imports: Local Application ===
 from app import db, bcrypt
+from app.analytics import CohortAnalytics
 from app.auth import (
     admin_required,
     client_required,
+    admin_or_client_required,
     authenticate_user,
     create_user_token,
+    get_current_role,
+    get_current_user,
 )
+from app.bulk import BulkWriter
+from app.catalog import CatalogCache
+from app.charts import CHART_DRAWERS, CHART_FORMATS, ChartCache, ChartData
+from app.deletion import CascadeDelete
+from app.encoding import RawJSON
+from app.jobs import BackgroundJobs, fan_out_video_job
+from app.loaders import ProgressLoader
 from app.localization import LocalizationHelper
 from app.models import (
     User,
@@ -69,7 +85,14 @@ from app.models import (
     WelcomeVideo,
     Question,
     UserQuestionAnswer,
+    BackgroundJob,
+    UserQuestionAnswerPayload,
 )
+from app.pagination import KeysetPaginator
+from app.payloads import PayloadStore
+from app.progress import ProgressCounters, ProgressProvisioner, ProgressVersions
+from app.reports import ReportCache
+from app.statistics import PlatformCounters, UserStatistics
 from app.validation import ValidationHelper
 
 
@@ -107,21 +130,6 @@ def serve_profile_picture(filename):
     return send_from_directory(current_app.config["PROFILE_UPLOAD_FOLDER"], filename)
 
 
-# Custom decorator to allow both admin and client roles
-def admin_or_client_required(f):
-    @jwt_required()
-    def wrapper(*args, **kwargs):
-        current_user_id = int(get_jwt_identity())
-        user = User.query.get(current_user_id)
-        lang = ValidationHelper.get_language_from_request()
-        if user.role not in ["admin", "client"]:
-            return LocalizationHelper.get_error_response("access_denied", lang, 403)
-        return f(*args, **kwargs)
-
-    wrapper.__name__ = f.__name__
-    return wrapper
-
-
 # Welcome Video Management Routes
 @bp.route("/welcome_video", methods=["POST"])
 @admin_required
@@ -201,6 +209,7 @@ def register():
     )
 
     db.session.add(user)
+    PlatformCounters.user_added(user.role)
     db.session.commit()
 
     token = create_user_token(user)
@@ -258,10 +267,10 @@ def login():
 @client_required
 def get_user(user_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
 
-    user = User.query.get(current_user_id)
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     target_user = User.query.get_or_404(user_id)
@@ -284,10 +293,10 @@ def get_user(user_id):
 @client_required
 def update_user(user_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
 
-    user = User.query.get(current_user_id)
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     target_user = User.query.get_or_404(user_id)
@@ -329,7 +338,8 @@ def update_user(user_id):
         target_user.picture = data["picture"]
 
     # Only admin can update role
-    if user.role == "admin" and "role" in data:
+    if current_role == "admin" and "role" in data:
+        PlatformCounters.user_role_changed(target_user.role, data["role"])
         target_user.role = data["role"]
 
     db.session.commit()
@@ -351,7 +361,15 @@ def update_user(user_id):
 @admin_required
 def get_all_users():
     lang = ValidationHelper.get_language_from_request()
-    users = User.query.all()
+    try:
+        users, pagination = KeysetPaginator.paginate(
+            User.query, [User.id], lambda u: [u.id]
+        )
+    except ValueError:
+        return LocalizationHelper.get_error_response(
+            "invalid_format", lang, 400, field="Pagination"
+        )
+    level_counts = ProgressLoader.load_level_counts([u.id for u in users])
     result = [
         {
             "id": user.id,
@@ -360,12 +378,15 @@ def get_all_users():
             "phone": user.phone,
             "role": user.role,
             "picture": user.picture,
-            "level_count": len(user.levels),
+            "level_count": level_counts[user.id],
         }
         for user in users
     ]
     return LocalizationHelper.get_success_response(
-        "operation_successful", {"users": result}, lang, status_code=200
+        "operation_successful",
+        {"users": result, "pagination": pagination},
+        lang,
+        status_code=200,
     )
 
 
@@ -373,24 +394,21 @@ def get_all_users():
 @client_required
 def delete_user(user_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
     
-    user = User.query.get(current_user_id)
-    
     # Check if user has permission to delete this account
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
     
     target_user = User.query.get_or_404(user_id)
+    picture = target_user.picture
 
-    # Delete all related data for the user
-    UserLevel.query.filter_by(user_id=user_id).delete()
-    ExamResult.query.filter_by(user_id=user_id).delete()
-    UserQuestionAnswer.query.filter_by(user_id=user_id).delete()
-    
-    # Delete the user
-    db.session.delete(target_user)
+    # Delete the user together with all related data
+    PlatformCounters.user_removed(user_id, target_user.role)
+    CascadeDelete.delete_user(user_id)
     db.session.commit()
+    CascadeDelete.remove_uploads_later(picture)
 
     return LocalizationHelper.get_success_response(
         "user_deleted_successfully", None, lang, status_code=200
@@ -443,21 +461,12 @@ def assign_level_to_user(user_id, level_id):
     db.session.add(user_level)
     db.session.flush()
 
-    level_videos = Video.query.filter_by(level_id=level_id).order_by(Video.id).all()
-
-    for i, video in enumerate(level_videos):
-        existing_progress = UserVideoProgress.query.filter_by(
-            user_level_id=user_level.id, video_id=video.id
-        ).first()
-        if not existing_progress:
-            video_progress = UserVideoProgress(
-                user_level_id=user_level.id,
-                video_id=video.id,
-                is_opened=(i == 0),
-                is_completed=False,
-            )
-            db.session.add(video_progress)
+    ProgressProvisioner.provision(
+        user_level.id, CatalogCache.get_catalog().video_sequence(level_id)
+    )
+    PlatformCounters.purchase_added(level_id)
 
+    ProgressVersions.bump(user_id)
     db.session.commit()
 
     return LocalizationHelper.get_success_response(
@@ -504,6 +513,9 @@ def create_level():
         level.image_path = f"/Uploads/levels/{unique_filename}"
 
     db.session.add(level)
+    db.session.flush()
+    PlatformCounters.level_added(level.id)
+    CatalogCache.bump_version()
     db.session.commit()
 
     response_data = {
@@ -606,6 +618,7 @@ def update_level(level_id):
                 )
 
     try:
+        CatalogCache.bump_version()
         db.session.commit()
     except Exception as e:
         db.session.rollback()
@@ -646,11 +659,45 @@ def update_level(level_id):
         "level_updated_successfully", response_data, lang, status_code=200
     )
 
-def _format_video_data(video):
-    """Helper function to format video data with questions"""
-    questions = (
-        Question.query.filter_by(video_id=video.id).order_by(Question.order).all()
+def _include_payload():
+    """Helper function to tell whether the client asked for raw SpeechAce payloads"""
+    return request.args.get("include_payload", "").lower() in ("1", "true", "yes")
+
+
+def _load_answer_payloads(answers_by_question):
+    """Helper function to load answer payloads if the client asked for them"""
+    if not _include_payload():
+        return None
+    return PayloadStore.load_answer_payloads(
+        answer.id for answer in answers_by_question.values()
+    )
+
+
+def _format_user_answer(user_answer, payloads=None):
+    """Helper function to format a user's answer to a question.
+
+    The raw SpeechAce response is only included when ``payloads`` were
+    loaded, i.e. when the client passed ``include_payload=true``.
+    """
+    answer_data = {
+        "percentage": user_answer.percentage if user_answer else None,
+    }
+    if payloads is not None:
+        answer_data["speechace_response"] = (
+            payloads.get(user_answer.id, {}) if user_answer else {}
+        )
+    answer_data["submitted_at"] = (
+        user_answer.submitted_at.isoformat() if user_answer else None
     )
+    return answer_data
+
+
+def _format_video_data(video, questions=None):
+    """Helper function to format video data with questions"""
+    if questions is None:
+        questions = (
+            Question.query.filter_by(video_id=video.id).order_by(Question.order).all()
+        )
     return {
         "id": video.id,
         "name": video.name,
@@ -667,15 +714,13 @@ def _format_video_data(video):
 def delete_level(level_id):
     lang = ValidationHelper.get_language_from_request()
     level = Level.query.get_or_404(level_id)
+    image_path = level.image_path
 
-    for video in level.videos:
-        db.session.delete(video)
-
-    for user_level in level.user_levels:
-        db.session.delete(user_level)
-
-    db.session.delete(level)
+    PlatformCounters.level_removed(level_id)
+    CascadeDelete.delete_level(level_id)
+    CatalogCache.bump_version()
     db.session.commit()
+    CascadeDelete.remove_uploads_later(image_path)
 
     return LocalizationHelper.get_success_response(
         "level_deleted_successfully", None, lang, status_code=200
@@ -683,44 +728,113 @@ def delete_level(level_id):
 
 
 
+def _catalog_etag(catalog, user_id, role):
+    """Helper function to compute the ETag of a catalog listing for the caller.
+
+    The ETag only depends on versions that every relevant write bumps, so an
+    unchanged poll can be answered without loading or serializing anything.
+    """
+    parts = [
+        catalog.version,
+        ValidationHelper.get_language_from_request(),
+        sorted(request.args.items(multi=True)),
+    ]
+    if user_id and role:
+        parts += [user_id, role, ProgressVersions.get(user_id)]
+        if role == "admin":
+            parts.append(PlatformCounters.get_enrollment_version())
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def _etag_headers(etag):
+    """Helper function to build the caching headers of a versioned response"""
+    return {"ETag": quote_etag(etag), "Cache-Control": "private, no-cache"}
+
+
+def _not_modified_or_none(etag):
+    """Helper function to answer a conditional request whose ETag matches"""
+    if request.if_none_match.contains(etag):
+        return "", 304, _etag_headers(etag)
+    return None
+
+
+def _filter_catalog_levels(catalog):
+    """Helper function to apply the level listing filters to the cached catalog"""
+    min_price = request.args.get("min_price", type=float)
+    max_price = request.args.get("max_price", type=float)
+    level_number = request.args.get("level_number", type=int)
+    name = request.args.get("name")
+
+    levels = catalog.levels
+
+    if min_price is not None:
+        levels = [level for level in levels if level.price >= min_price]
+    if max_price is not None:
+        levels = [level for level in levels if level.price <= max_price]
+    if level_number is not None:
+        levels = [level for level in levels if level.level_number == level_number]
+    if name:
+        levels = [level for level in levels if name.lower() in level.name.lower()]
+
+    return list(levels)
+
+
 @bp.route("/levels", methods=["GET"])
 def get_levels():
     lang = ValidationHelper.get_language_from_request()
     
     # Check if user is authenticated (optional)
     current_user_id = None
-    user = None
+    current_role = None
     try:
         from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
         verify_jwt_in_request(optional=True)
         current_user_id = get_jwt_identity()
         if current_user_id:
             current_user_id = int(current_user_id)
-            user = User.query.get(current_user_id)
+            current_role = get_current_role()
     except:
         # User is not authenticated (guest access)
         pass
 
-    min_price = request.args.get("min_price", type=float)
-    max_price = request.args.get("max_price", type=float)
-    level_number = request.args.get("level_number", type=int)
-    name = request.args.get("name")
-
-    query = Level.query
-
-    if min_price is not None:
-        query = query.filter(Level.price >= min_price)
-    if max_price is not None:
-        query = query.filter(Level.price <= max_price)
-    if level_number is not None:
-        query = query.filter(Level.level_number == level_number)
-    if name:
-        query = query.filter(Level.name.ilike(f"%{name}%"))
+    catalog = CatalogCache.get_catalog()
+    etag = _catalog_etag(catalog, current_user_id, current_role)
+    not_modified = _not_modified_or_none(etag)
+    if not_modified:
+        return not_modified
+
+    levels = _filter_catalog_levels(catalog)
+    level_ids = [level.id for level in levels]
+
+    # Personalized data is loaded for all levels at once, so the number of
+    # queries stays constant no matter how large the catalog grows
+    user_levels = {}
+    progress_by_video = {}
+    answers_by_question = {}
+    user_counts = {}
+    if current_user_id and current_role:
+        user_levels = ProgressLoader.load_user_levels(current_user_id, level_ids)
+        progress_by_video = ProgressLoader.load_video_progress(
+            [user_level.id for user_level in user_levels.values()]
+        )
+        if current_role == "client":
+            answers_by_question = ProgressLoader.load_answers(
+                current_user_id,
+                [
+                    question.id
+                    for level_id in user_levels
+                    for video in catalog.videos_for_level(level_id)
+                    for question in catalog.questions_for_video(video.id)
+                ],
+            )
+        if current_role == "admin":
+            user_counts = ProgressLoader.load_user_counts(level_ids)
+    answer_payloads = _load_answer_payloads(answers_by_question)
 
-    levels = query.order_by(Level.level_number).all()
     result = []
 
     for level in levels:
+        level_videos = catalog.videos_for_level(level.id)
         level_data = {
             "id": level.id,
             "name": level.name,
@@ -731,62 +845,37 @@ def get_levels():
             "price": level.price,
             "initial_exam_question": level.initial_exam_question,
             "final_exam_question": level.final_exam_question,
-            "videos_count": len(level.videos),
+            "videos_count": len(level_videos),
             "videos": [],
             "is_completed": False,
             "can_take_final_exam": False,
         }
 
         # If user is authenticated, provide personalized data
-        if current_user_id and user:
-            user_level = UserLevel.query.filter_by(
-                user_id=current_user_id, level_id=level.id
-            ).first()
+        if current_user_id and current_role:
+            user_level = user_levels.get(level.id)
             if user_level:
                 level_data["is_completed"] = user_level.is_completed
                 level_data["can_take_final_exam"] = user_level.can_take_final_exam
 
-                for video in level.videos:
-                    video_progress = UserVideoProgress.query.filter_by(
-                        user_level_id=user_level.id, video_id=video.id
-                    ).first()
-
-                    questions = (
-                        Question.query.filter_by(video_id=video.id)
-                        .order_by(Question.order)
-                        .all()
-                    )
+                for video in level_videos:
+                    video_progress = progress_by_video.get((user_level.id, video.id))
                     questions_data = []
 
-                    if user.role == "admin" or (
+                    if current_role == "admin" or (
                         video_progress and video_progress.is_opened
                     ):
-                        for question in questions:
+                        for question in catalog.questions_for_video(video.id):
                             question_data = {
                                 "id": question.id,
                                 "text": question.text,
                                 "order": question.order,
                             }
-                            if user.role == "client":
-                                user_answer = UserQuestionAnswer.query.filter_by(
-                                    user_id=current_user_id, question_id=question.id
-                                ).first()
-                                if user_answer:
-                                    question_data["user_answer"] = {
-                                        "percentage": user_answer.percentage,
-                                        "speechace_response": (
-                                            json.loads(user_answer.speechace_response)
-                                            if user_answer.speechace_response
-                                            else {}
-                                        ),
-                                        "submitted_at": user_answer.submitted_at.isoformat(),
-                                    }
-                                else:
-                                    question_data["user_answer"] = {
-                                        "percentage": None,
-                                        "speechace_response": {},
-                                        "submitted_at": None,
-                                    }
+                            if current_role == "client":
+                                question_data["user_answer"] = _format_user_answer(
+                                    answers_by_question.get(question.id),
+                                    answer_payloads,
+                                )
                             questions_data.append(question_data)
 
                     video_data = {
@@ -795,7 +884,7 @@ def get_levels():
                         "order": video.order,
                         "youtube_link": (
                             video.youtube_link
-                            if user.role == "admin"
+                            if current_role == "admin"
                             else (
                                 video.youtube_link
                                 if video_progress and video_progress.is_opened
@@ -815,11 +904,11 @@ def get_levels():
                         "order": v.order,
                         "youtube_link": "",
                         "questions": []
-                    } for v in level.videos
+                    } for v in level_videos
                 ]
 
-            if user.role == "admin":
-                level_data["user_count"] = len(level.user_levels)
+            if current_role == "admin":
+                level_data["user_count"] = user_counts[level.id]
         else:
             # Guest user - provide basic video structure without content
             level_data["videos"] = [
@@ -829,36 +918,29 @@ def get_levels():
                     "order": v.order,
                     "youtube_link": "",
                     "questions": []
-                } for v in level.videos
+                } for v in level_videos
             ]
 
         result.append(level_data)
 
-    return LocalizationHelper.get_success_response(
+    response, status_code = LocalizationHelper.get_success_response(
         "operation_successful", {"levels": result}, lang, status_code=200
     )
+    return response, status_code, _etag_headers(etag)
 
 @bp.route("/admin/levels", methods=["GET"])
 @admin_required
 def admin_get_all_levels():
     lang = ValidationHelper.get_language_from_request()
-    min_price = request.args.get("min_price", type=float)
-    max_price = request.args.get("max_price", type=float)
-    level_number = request.args.get("level_number", type=int)
-    name = request.args.get("name")
-
-    query = Level.query
-
-    if min_price is not None:
-        query = query.filter(Level.price >= min_price)
-    if max_price is not None:
-        query = query.filter(Level.price <= max_price)
-    if level_number is not None:
-        query = query.filter(Level.level_number == level_number)
-    if name:
-        query = query.filter(Level.name.ilike(f"%{name}%"))
-
-    levels = query.order_by(Level.level_number).all()
+    catalog = CatalogCache.get_catalog()
+    etag = _catalog_etag(catalog, int(get_jwt_identity()), "admin")
+    not_modified = _not_modified_or_none(etag)
+    if not_modified:
+        return not_modified
+
+    levels = _filter_catalog_levels(catalog)
+    level_ids = [level.id for level in levels]
+    user_counts = ProgressLoader.load_user_counts(level_ids)
     result = [
         {
             "id": level.id,
@@ -870,15 +952,19 @@ def admin_get_all_levels():
             "price": level.price,
             "initial_exam_question": level.initial_exam_question,
             "final_exam_question": level.final_exam_question,
-            "videos_count": len(level.videos),
-            "videos": [_format_video_data(v) for v in level.videos],
-            "user_count": len(level.user_levels),
+            "videos_count": len(catalog.videos_for_level(level.id)),
+            "videos": [
+                _format_video_data(v, catalog.questions_for_video(v.id))
+                for v in catalog.videos_for_level(level.id)
+            ],
+            "user_count": user_counts[level.id],
         }
         for level in levels
     ]
-    return LocalizationHelper.get_success_response(
+    response, status_code = LocalizationHelper.get_success_response(
         "operation_successful", {"levels": result}, lang, status_code=200
     )
+    return response, status_code, _etag_headers(etag)
 
 
 @bp.route("/levels/<int:level_id>", methods=["GET"])
@@ -886,7 +972,11 @@ def admin_get_all_levels():
 def get_level(level_id):
     current_user_id = int(get_jwt_identity())
     lang = ValidationHelper.get_language_from_request()
-    level = Level.query.get_or_404(level_id)
+    catalog = CatalogCache.get_catalog()
+    level = catalog.get_level(level_id)
+    if level is None:
+        abort(404)
+    level_videos = catalog.videos_for_level(level.id)
 
     level_data = {
         "id": level.id,
@@ -898,7 +988,7 @@ def get_level(level_id):
         "price": level.price,
         "initial_exam_question": level.initial_exam_question,
         "final_exam_question": level.final_exam_question,
-        "videos_count": len(level.videos),
+        "videos_count": len(level_videos),
         "videos": [],
         "is_completed": False,
         "can_take_final_exam": False,
@@ -911,43 +1001,31 @@ def get_level(level_id):
         level_data["is_completed"] = user_level.is_completed
         level_data["can_take_final_exam"] = user_level.can_take_final_exam
 
-        for video in level.videos:
-            video_progress = UserVideoProgress.query.filter_by(
-                user_level_id=user_level.id, video_id=video.id
-            ).first()
+        progress_by_video = ProgressLoader.load_video_progress([user_level.id])
+        answers_by_question = ProgressLoader.load_answers(
+            current_user_id,
+            [
+                question.id
+                for video in level_videos
+                for question in catalog.questions_for_video(video.id)
+            ],
+        )
+        answer_payloads = _load_answer_payloads(answers_by_question)
 
-            questions = (
-                Question.query.filter_by(video_id=video.id)
-                .order_by(Question.order)
-                .all()
-            )
+        for video in level_videos:
+            video_progress = progress_by_video.get((user_level.id, video.id))
             questions_data = []
 
-            for question in questions:
+            for question in catalog.questions_for_video(video.id):
                 question_data = {
                     "id": question.id,
                     "text": question.text,
                     "order": question.order,
+                    "user_answer": _format_user_answer(
+                        answers_by_question.get(question.id),
+                        answer_payloads,
+                    ),
                 }
-                user_answer = UserQuestionAnswer.query.filter_by(
-                    user_id=current_user_id, question_id=question.id
-                ).first()
-                if user_answer:
-                    question_data["user_answer"] = {
-                        "percentage": user_answer.percentage,
-                        "speechace_response": (
-                            json.loads(user_answer.speechace_response)
-                            if user_answer.speechace_response
-                            else {}
-                        ),
-                        "submitted_at": user_answer.submitted_at.isoformat(),
-                    }
-                else:
-                    question_data["user_answer"] = {
-                        "percentage": None,
-                        "speechace_response": {},
-                        "submitted_at": None,
-                    }
                 questions_data.append(question_data)
 
             video_data = {
@@ -968,7 +1046,7 @@ def get_level(level_id):
                 "order": v.order,
                 "youtube_link": "",
                 "questions": []
-            } for v in level.videos
+            } for v in level_videos
         ]
 
     return LocalizationHelper.get_success_response(
@@ -1000,40 +1078,27 @@ def add_video_to_level(level_id):
     db.session.add(video)
     db.session.flush()
 
-    user_levels = UserLevel.query.filter_by(level_id=level_id).all()
-
-    for user_level in user_levels:
-        existing_progress_count = UserVideoProgress.query.filter_by(
-            user_level_id=user_level.id
-        ).count()
-
-        is_opened = False
-        if existing_progress_count == 0:
-            is_opened = True
-        else:
-            completed_videos = UserVideoProgress.query.filter_by(
-                user_level_id=user_level.id,
-                is_completed=True
-            ).count()
-
-            if completed_videos == existing_progress_count:
-                is_opened = True
-
-        video_progress = UserVideoProgress(
-            user_level_id=user_level.id,
-            video_id=video.id,
-            is_opened=is_opened,
-            is_completed=False,
-        )
-        db.session.add(video_progress)
+    # Owners of the level get a progress row for the new video, either right
+    # away or, for heavily enrolled levels, from a background job
+    enrollment_count = UserLevel.query.filter_by(level_id=level_id).count()
+    fan_out_job = None
+    if enrollment_count > current_app.config["PROGRESS_FANOUT_BACKGROUND_THRESHOLD"]:
+        fan_out_job = BackgroundJobs.create("video_progress_fan_out", enrollment_count)
+    else:
+        ProgressProvisioner.fan_out_video(video.id, level_id)
 
+    CatalogCache.bump_version()
     db.session.commit()
 
+    if fan_out_job is not None:
+        BackgroundJobs.start(fan_out_job.id, fan_out_video_job, video.id, level_id)
+
     response_data = {
         "id": video.id,
         "name": video.name,
         "order": video.order,
         "youtube_link": video.youtube_link,
+        "fan_out_job": BackgroundJobs.to_dict(fan_out_job) if fan_out_job else None,
         "questions": [],
     }
     return LocalizationHelper.get_success_response(
@@ -1053,6 +1118,7 @@ def update_video(video_id):
     if "order" in data:
         video.order = data.get("order")
     
+    CatalogCache.bump_version()
     db.session.commit()
 
     response_data = {
@@ -1073,13 +1139,10 @@ def update_video(video_id):
 @admin_required
 def delete_video(video_id):
     lang = ValidationHelper.get_language_from_request()
-    video = Video.query.get_or_404(video_id)
+    Video.query.get_or_404(video_id)
 
-    user_progresses = UserVideoProgress.query.filter_by(video_id=video_id).all()
-    for progress in user_progresses:
-        db.session.delete(progress)
-
-    db.session.delete(video)
+    CascadeDelete.delete_video(video_id)
+    CatalogCache.bump_version()
     db.session.commit()
 
     return LocalizationHelper.get_success_response(
@@ -1091,7 +1154,17 @@ def delete_video(video_id):
 @admin_required
 def get_all_videos():
     lang = ValidationHelper.get_language_from_request()
-    videos = Video.query.order_by(Video.level_id, Video.order).all()
+    try:
+        videos, pagination = KeysetPaginator.paginate(
+            Video.query.options(joinedload(Video.level), selectinload(Video.questions)),
+            [Video.level_id, Video.order, Video.id],
+            lambda v: [v.level_id, v.order, v.id],
+        )
+    except ValueError:
+        return LocalizationHelper.get_error_response(
+            "invalid_format", lang, 400, field="Pagination"
+        )
+    progress_counts = ProgressLoader.load_progress_counts([v.id for v in videos])
     result = [
         {
             "id": video.id,
@@ -1101,16 +1174,18 @@ def get_all_videos():
             "order": video.order,
             "youtube_link": video.youtube_link,
             "questions": [
-                {"id": q.id, "text": q.text, "order": q.order} for q in video.questions
+                {"id": q.id, "text": q.text, "order": q.order}
+                for q in sorted(video.questions, key=lambda q: q.id)
             ],
-            "user_progress_count": UserVideoProgress.query.filter_by(
-                video_id=video.id
-            ).count(),
+            "user_progress_count": progress_counts[video.id],
         }
         for video in videos
     ]
     return LocalizationHelper.get_success_response(
-        "operation_successful", {"videos": result}, lang, status_code=200
+        "operation_successful",
+        {"videos": result, "pagination": pagination},
+        lang,
+        status_code=200,
     )
 
 @bp.route("/levels/<int:level_id>/videos/reorder", methods=["PATCH"])
@@ -1131,30 +1206,46 @@ def reorder_videos(level_id):
             "required_field", lang, 400, field="video_orders"
         )
     
+    new_orders = {}
+    for item in video_orders:
+        video_id = item.get("video_id") if isinstance(item, dict) else None
+        new_order = item.get("order") if isinstance(item, dict) else None
+
+        if not isinstance(video_id, int) or not isinstance(new_order, int):
+            return LocalizationHelper.get_error_response(
+                "invalid_format", lang, 400, field="video_orders"
+            )
+        new_orders[video_id] = new_order
+
     try:
-        for item in video_orders:
-            video_id = item.get("video_id")
-            new_order = item.get("order")
-            
-            if video_id is None or new_order is None:
-                return LocalizationHelper.get_error_response(
-                    "invalid_format", lang, 400, field="video_orders"
-                )
-            
-            video = Video.query.filter_by(id=video_id, level_id=level_id).first()
-            if not video:
-                return LocalizationHelper.get_error_response(
-                    "video_not_found", lang, 404
-                )
-            
-            video.order = new_order
-        
+        found_ids = {
+            video_id
+            for (video_id,) in db.session.query(Video.id).filter(
+                Video.level_id == level_id, Video.id.in_(new_orders)
+            )
+        }
+        if len(found_ids) != len(new_orders):
+            return LocalizationHelper.get_error_response(
+                "video_not_found", lang, 404
+            )
+
+        # One UPDATE ... SET order = CASE id WHEN ... END for the whole list
+        Video.query.filter(Video.id.in_(new_orders)).update(
+            {Video.order: db.case(new_orders, value=Video.id)},
+            synchronize_session=False,
+        )
+        CatalogCache.bump_version()
         db.session.commit()
-        
+
         # Return updated videos list
-        videos = Video.query.filter_by(level_id=level_id).order_by(Video.order).all()
-        videos_data = [_format_video_data(v) for v in videos]
-        
+        catalog = CatalogCache.get_catalog()
+        videos_data = [
+            _format_video_data(
+                catalog.get_video(video_id), catalog.questions_for_video(video_id)
+            )
+            for video_id in catalog.video_sequence(level_id)
+        ]
+
         return LocalizationHelper.get_success_response(
             "video_updated_successfully", 
             {"videos": videos_data}, 
@@ -1185,6 +1276,7 @@ def create_question(video_id):
     )
 
     db.session.add(question)
+    CatalogCache.bump_version()
     db.session.commit()
 
     response_data = {
@@ -1208,6 +1300,7 @@ def update_question(question_id):
 
     question.text = data.get("text", question.text)
     question.order = data.get("order", question.order)
+    CatalogCache.bump_version()
     db.session.commit()
 
     response_data = {
@@ -1226,11 +1319,10 @@ def update_question(question_id):
 @admin_required
 def delete_question(question_id):
     lang = ValidationHelper.get_language_from_request()
-    question = Question.query.get_or_404(question_id)
+    Question.query.get_or_404(question_id)
 
-    UserQuestionAnswer.query.filter_by(question_id=question_id).delete()
-
-    db.session.delete(question)
+    CascadeDelete.delete_question(question_id)
+    CatalogCache.bump_version()
     db.session.commit()
 
     return LocalizationHelper.get_success_response(
@@ -1242,7 +1334,19 @@ def delete_question(question_id):
 @admin_required
 def get_all_questions():
     lang = ValidationHelper.get_language_from_request()
-    questions = Question.query.order_by(Question.video_id, Question.order).all()
+    try:
+        questions, pagination = KeysetPaginator.paginate(
+            Question.query.options(
+                joinedload(Question.video).joinedload(Video.level)
+            ),
+            [Question.video_id, Question.order, Question.id],
+            lambda q: [q.video_id, q.order, q.id],
+        )
+    except ValueError:
+        return LocalizationHelper.get_error_response(
+            "invalid_format", lang, 400, field="Pagination"
+        )
+    answer_counts = ProgressLoader.load_answer_counts([q.id for q in questions])
     result = [
         {
             "id": question.id,
@@ -1256,14 +1360,15 @@ def get_all_questions():
             "text": question.text,
             "order": question.order,
             "created_at": question.created_at.isoformat(),
-            "answers_count": UserQuestionAnswer.query.filter_by(
-                question_id=question.id
-            ).count(),
+            "answers_count": answer_counts[question.id],
         }
         for question in questions
     ]
     return LocalizationHelper.get_success_response(
-        "operation_successful", {"questions": result}, lang, status_code=200
+        "operation_successful",
+        {"questions": result, "pagination": pagination},
+        lang,
+        status_code=200,
     )
 
 
@@ -1271,13 +1376,20 @@ def get_all_questions():
 @admin_or_client_required
 def get_video_questions(video_id):
     lang = ValidationHelper.get_language_from_request()
-    video = Video.query.get_or_404(video_id)
+    catalog = CatalogCache.get_catalog()
+    video = catalog.get_video(video_id)
+    if video is None:
+        abort(404)
     current_user_id = int(get_jwt_identity())
-    user = User.query.get(current_user_id)
+    current_role = get_current_role()
 
-    questions = (
-        Question.query.filter_by(video_id=video_id).order_by(Question.order).all()
-    )
+    questions = catalog.questions_for_video(video_id)
+    answers_by_question = {}
+    if current_role == "client":
+        answers_by_question = ProgressLoader.load_answers(
+            current_user_id, [question.id for question in questions]
+        )
+    answer_payloads = _load_answer_payloads(answers_by_question)
     result = []
 
     for question in questions:
@@ -1289,27 +1401,11 @@ def get_video_questions(video_id):
             "created_at": question.created_at.isoformat(),
         }
 
-        if user.role == "client":
-            user_answer = UserQuestionAnswer.query.filter_by(
-                user_id=current_user_id,
-                question_id=question.id
-            ).first()
-
-            if user_answer:
-                question_data["user_answer"] = {
-                    "percentage": user_answer.percentage,
-                    "speechace_response": (
-                        json.loads(user_answer.speechace_response)
-                        if user_answer.speechace_response else {}
-                    ),
-                    "submitted_at": user_answer.submitted_at.isoformat(),
-                }
-            else:
-                question_data["user_answer"] = {
-                    "percentage": None,
-                    "speechace_response": {},
-                    "submitted_at": None,
-                }
+        if current_role == "client":
+            question_data["user_answer"] = _format_user_answer(
+                answers_by_question.get(question.id),
+                answer_payloads,
+            )
 
         result.append(question_data)
 
@@ -1330,6 +1426,43 @@ def extract_pronunciation_score(speechace_response):
     except (KeyError, TypeError, ValueError):
         return 0.0
 
+def _save_answers(user_id, speechace_responses):
+    """Store answers keyed by question id with one upsert.
+
+    Resubmitting a question overwrites the user's previous answer in place.
+    Returns ({question_id: UserQuestionAnswer}, {question_id: RawJSON}) with
+    the payloads encoded once, for storage and for echoing them back.
+    """
+    payloads = {
+        question_id: RawJSON(PayloadStore.encode(speechace_response))
+        for question_id, speechace_response in speechace_responses.items()
+    }
+    submitted_at = datetime.utcnow()
+    answers = BulkWriter.upsert(
+        UserQuestionAnswer,
+        [
+            {
+                "user_id": user_id,
+                "question_id": question_id,
+                # The raw payload is stored compressed by PayloadStore
+                "speechace_response": None,
+                "percentage": extract_pronunciation_score(speechace_response),
+                "submitted_at": submitted_at,
+            }
+            for question_id, speechace_response in speechace_responses.items()
+        ],
+        index_elements=["user_id", "question_id"],
+        update_columns=["speechace_response", "percentage", "submitted_at"],
+    )
+    answers_by_question = {answer.question_id: answer for answer in answers}
+    PayloadStore.save_answer_payloads(
+        {
+            answers_by_question[question_id].id: payload
+            for question_id, payload in payloads.items()
+        }
+    )
+    return answers_by_question, payloads
+
 # Update submit_question_answer
 @bp.route("/questions/<int:question_id>/submit", methods=["POST"])
 @client_required
@@ -1345,7 +1478,6 @@ def submit_question_answer(question_id):
         )
 
     speechace_response = data["speechace_response"]
-    percentage = extract_pronunciation_score(speechace_response)
 
     user_level = (
         UserLevel.query.join(Level)
@@ -1364,39 +1496,97 @@ def submit_question_answer(question_id):
     if not video_progress or not video_progress.is_opened:
         return LocalizationHelper.get_error_response("video_must_be_opened", lang, 400)
 
-    existing_answer = UserQuestionAnswer.query.filter_by(
-        user_id=current_user_id, question_id=question_id
-    ).first()
-
-    if existing_answer:
-        existing_answer.speechace_response = json.dumps(speechace_response)
-        existing_answer.percentage = percentage
-        existing_answer.submitted_at = datetime.utcnow()
-        answer = existing_answer
-    else:
-        answer = UserQuestionAnswer(
-            user_id=current_user_id,
-            question_id=question_id,
-            speechace_response=json.dumps(speechace_response),
-            percentage=percentage,
-            submitted_at=datetime.utcnow()
-        )
-        db.session.add(answer)
-
-    db.session.commit()
+    answers, payloads = _save_answers(current_user_id, {question_id: speechace_response})
+    answer = answers[question_id]
+    ProgressVersions.bump(current_user_id)
 
+    # Built before the commit, which would expire the answer
     response_data = {
         "id": answer.id,
         "question_id": question_id,
         "question_text": question.text,
         "percentage": answer.percentage,
-        "speechace_response": json.loads(answer.speechace_response) if answer.speechace_response else {},
+        "speechace_response": payloads[question_id],
         "submitted_at": answer.submitted_at.isoformat(),
     }
+    db.session.commit()
+
     return LocalizationHelper.get_success_response(
         "answer_submitted_successfully", response_data, lang, status_code=200
     )
 
+@bp.route("/questions/submit_batch", methods=["POST"])
+@client_required
+def submit_question_answers_batch():
+    """Submit answers to many questions in one request and one transaction.
+
+    The whole batch is rejected if any question is unknown, not purchased or
+    not opened yet. A question listed twice keeps its last answer.
+    """
+    current_user_id = int(get_jwt_identity())
+    lang = ValidationHelper.get_language_from_request()
+    data = request.get_json(silent=True) or {}
+
+    items = data.get("answers")
+    if not isinstance(items, list) or not items:
+        return LocalizationHelper.get_error_response(
+            "required_field", lang, 400, field="answers"
+        )
+    max_size = current_app.config["ANSWER_BATCH_MAX_SIZE"]
+    if len(items) > max_size:
+        return LocalizationHelper.get_error_response(
+            "too_many_answers", lang, 400, max=max_size
+        )
+
+    responses = {}
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("question_id"), int):
+            return LocalizationHelper.get_error_response(
+                "invalid_format", lang, 400, field="answers"
+            )
+        if "speechace_response" not in item:
+            return LocalizationHelper.get_error_response(
+                "required_field", lang, 400, field="speechace_response"
+            )
+        responses[item["question_id"]] = item["speechace_response"]
+
+    entitlements = ProgressLoader.load_answer_entitlements(
+        current_user_id, list(responses)
+    )
+    for question_id in responses:
+        entitlement = entitlements.get(question_id)
+        if entitlement is None:
+            error = LocalizationHelper.get_error_response("question_not_found", lang, 404)
+        elif entitlement.user_level_id is None:
+            error = LocalizationHelper.get_error_response("level_not_purchased", lang, 403)
+        elif not entitlement.is_opened:
+            error = LocalizationHelper.get_error_response("video_must_be_opened", lang, 400)
+        else:
+            continue
+        error[0]["question_id"] = question_id
+        return error
+
+    answers, payloads = _save_answers(current_user_id, responses)
+    ProgressVersions.bump(current_user_id)
+
+    # Built before the commit, which would expire every answer
+    answers_data = [
+        {
+            "id": answers[question_id].id,
+            "question_id": question_id,
+            "question_text": entitlements[question_id].Question.text,
+            "percentage": answers[question_id].percentage,
+            "speechace_response": payloads[question_id],
+            "submitted_at": answers[question_id].submitted_at.isoformat(),
+        }
+        for question_id in responses
+    ]
+    db.session.commit()
+
+    return LocalizationHelper.get_success_response(
+        "answers_submitted_successfully", {"answers": answers_data}, lang
+    )
+
 # Update submit_initial_exam
 @bp.route("/exams/<int:level_id>/initial", methods=["POST"])
 @client_required
@@ -1422,7 +1612,6 @@ def submit_initial_exam(level_id):
     exam_result = ExamResult(
         user_id=current_user_id,
         level_id=level_id,
-        speechace_response=json.dumps(speechace_response),
         percentage=percentage,
         type="initial",
     )
@@ -1430,6 +1619,9 @@ def submit_initial_exam(level_id):
     user_level.initial_exam_score = percentage
 
     db.session.add(exam_result)
+    db.session.flush()
+    PayloadStore.save_exam_payload(exam_result.id, speechace_response)
+    ProgressVersions.bump(current_user_id)
     db.session.commit()
 
     response_data = {
@@ -1470,7 +1662,6 @@ def submit_final_exam(level_id):
     exam_result = ExamResult(
         user_id=current_user_id,
         level_id=level_id,
-        speechace_response=json.dumps(speechace_response),
         percentage=percentage,
         type="final",
     )
@@ -1479,9 +1670,12 @@ def submit_final_exam(level_id):
     if user_level.initial_exam_score is not None:
         user_level.score_difference = percentage - user_level.initial_exam_score
 
-    user_level.is_completed = True
+    PlatformCounters.complete_level(user_level)
 
     db.session.add(exam_result)
+    db.session.flush()
+    PayloadStore.save_exam_payload(exam_result.id, speechace_response)
+    ProgressVersions.bump(current_user_id)
     db.session.commit()
 
     response_data = {
@@ -1498,10 +1692,10 @@ def submit_final_exam(level_id):
 @client_required
 def get_user_question_answer(user_id, question_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
-    user = User.query.get(current_user_id)
 
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     answer = UserQuestionAnswer.query.filter_by(
@@ -1517,13 +1711,10 @@ def get_user_question_answer(user_id, question_id):
         "id": answer.id,
         "question_id": question_id,
         "question_text": question.text if question else "",
-        "percentage": answer.percentage,
-        "speechace_response": (
-            json.loads(answer.speechace_response)
-            if answer.speechace_response else {}
-        ),
-        "submitted_at": answer.submitted_at.isoformat(),
     }
+    response_data.update(
+        _format_user_answer(answer, _load_answer_payloads({question_id: answer}))
+    )
 
     return LocalizationHelper.get_success_response(
         "operation_successful", response_data, lang, status_code=200
@@ -1535,27 +1726,37 @@ def get_user_question_answer(user_id, question_id):
 def get_question_answers(question_id):
     lang = ValidationHelper.get_language_from_request()
     question = Question.query.get_or_404(question_id)
-    answers = UserQuestionAnswer.query.filter_by(question_id=question_id).all()
+    try:
+        answers, pagination = KeysetPaginator.paginate(
+            UserQuestionAnswer.query.options(
+                joinedload(UserQuestionAnswer.user)
+            ).filter_by(question_id=question_id),
+            [UserQuestionAnswer.id],
+            lambda a: [a.id],
+        )
+    except ValueError:
+        return LocalizationHelper.get_error_response(
+            "invalid_format", lang, 400, field="Pagination"
+        )
 
-    result = [
-        {
+    answer_payloads = _load_answer_payloads(
+        {answer.id: answer for answer in answers}
+    )
+    result = []
+    for answer in answers:
+        answer_data = {
             "id": answer.id,
             "user_id": answer.user_id,
             "user_name": answer.user.name if answer.user else "",
-            "percentage": answer.percentage,
-            "speechace_response": (
-                json.loads(answer.speechace_response)
-                if answer.speechace_response else {}
-            ),
-            "submitted_at": answer.submitted_at.isoformat(),
         }
-        for answer in answers
-    ]
+        answer_data.update(_format_user_answer(answer, answer_payloads))
+        result.append(answer_data)
 
     response_data = {
         "question_id": question_id,
         "question_text": question.text,
         "answers": result,
+        "pagination": pagination,
     }
 
     return LocalizationHelper.get_success_response(
@@ -1563,6 +1764,83 @@ def get_question_answers(question_id):
     )
 
 
+
+@bp.route("/admin/questions/<int:question_id>/answers/export", methods=["GET"])
+@admin_required
+def export_question_answers(question_id):
+    """
+    Stream all answers to a question as newline-delimited JSON.
+    Rows are read through a server-side cursor in batches, so memory use does
+    not depend on the number of answers. Pass include_payload=true to add
+    the raw SpeechAce response.
+    """
+    question = Question.query.get_or_404(question_id)
+    include_payload = _include_payload()
+    batch_size = current_app.config["ANSWER_EXPORT_BATCH_SIZE"]
+
+    columns = [
+        UserQuestionAnswer.id,
+        UserQuestionAnswer.user_id,
+        User.name,
+        UserQuestionAnswer.percentage,
+        UserQuestionAnswer.submitted_at,
+    ]
+    if include_payload:
+        columns += [
+            UserQuestionAnswerPayload.codec,
+            UserQuestionAnswerPayload.data,
+            UserQuestionAnswer.speechace_response,
+        ]
+
+    rows = db.session.query(*columns).outerjoin(
+        User, User.id == UserQuestionAnswer.user_id
+    )
+    if include_payload:
+        rows = rows.outerjoin(
+            UserQuestionAnswerPayload,
+            UserQuestionAnswerPayload.answer_id == UserQuestionAnswer.id,
+        )
+    rows = (
+        rows.filter(UserQuestionAnswer.question_id == question.id)
+        .order_by(UserQuestionAnswer.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    def generate():
+        for row in rows:
+            answer_data = {
+                "id": row.id,
+                "question_id": question_id,
+                "user_id": row.user_id,
+                "user_name": row.name or "",
+                "percentage": row.percentage,
+                "submitted_at": row.submitted_at.isoformat(),
+            }
+            if include_payload:
+                answer_data["speechace_response"] = PayloadStore.decode(
+                    row.codec, row.data, row.speechace_response
+                )
+            yield current_app.json.dumps(
+                answer_data, ensure_ascii=False, sort_keys=False
+            ) + "\n"
+
+    return current_app.response_class(
+        stream_with_context(generate()), mimetype="application/x-ndjson"
+    )
+
+@bp.route("/admin/jobs/<int:job_id>", methods=["GET"])
+@admin_required
+def admin_get_job(job_id):
+    """Report the status and progress of a background job"""
+    lang = ValidationHelper.get_language_from_request()
+    job = db.session.get(BackgroundJob, job_id)
+    if not job:
+        return LocalizationHelper.get_error_response("job_not_found", lang, 404)
+
+    return LocalizationHelper.get_success_response(
+        "job_retrieved_successfully", {"job": BackgroundJobs.to_dict(job)}, lang
+    )
+
 @bp.route(
     "/users/<int:user_id>/levels/<int:level_id>/videos/<int:video_id>/complete",
     methods=["PATCH"],
@@ -1570,56 +1848,44 @@ def get_question_answers(question_id):
 @client_required
 def complete_video(user_id, level_id, video_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
 
-    user = User.query.get(current_user_id)
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     user_level = UserLevel.query.filter_by(user_id=user_id, level_id=level_id).first()
     if not user_level:
         return LocalizationHelper.get_error_response("level_not_purchased", lang, 400)
 
-    video_progress = UserVideoProgress.query.filter_by(
-        user_level_id=user_level.id, video_id=video_id
-    ).first()
+    catalog = CatalogCache.get_catalog()
+    next_video_id = catalog.next_video_id(level_id, video_id)
+
+    # The current and the next video's progress rows are fetched together
+    progress_by_video = {
+        progress.video_id: progress
+        for progress in UserVideoProgress.query.filter(
+            UserVideoProgress.user_level_id == user_level.id,
+            UserVideoProgress.video_id.in_([video_id, next_video_id]),
+        )
+    }
+    video_progress = progress_by_video.get(video_id)
 
     if not video_progress:
         return LocalizationHelper.get_error_response("video_not_accessible", lang, 400)
 
-    video_progress.is_completed = True
+    completed_count = ProgressCounters.mark_completed(video_progress)
 
-    level_videos = Video.query.filter_by(level_id=level_id).order_by(Video.id).all()
+    next_video_progress = progress_by_video.get(next_video_id)
+    if next_video_progress:
+        next_video_progress.is_opened = True
 
-    current_video_index = None
-    for i, video in enumerate(level_videos):
-        if video.id == video_id:
-            current_video_index = i
-            break
-
-    if current_video_index is not None and (current_video_index + 1) < len(
-        level_videos
+    if completed_count is not None and completed_count >= len(
+        catalog.video_sequence(level_id)
     ):
-        next_video = level_videos[current_video_index + 1]
-        next_video_progress = UserVideoProgress.query.filter_by(
-            user_level_id=user_level.id, video_id=next_video.id
-        ).first()
-
-        if next_video_progress:
-            next_video_progress.is_opened = True
-
-    all_videos_completed = all(
-        UserVideoProgress.query.filter_by(
-            user_level_id=user_level.id, video_id=video.id
-        )
-        .first()
-        .is_completed
-        for video in level_videos
-    )
-
-    if all_videos_completed:
         user_level.can_take_final_exam = True
 
+    ProgressVersions.bump(user_id)
     db.session.commit()
 
     return LocalizationHelper.get_success_response(
@@ -1633,39 +1899,38 @@ def complete_video(user_id, level_id, video_id):
 @client_required
 def get_user_exam_results(level_id, user_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
 
-    user = User.query.get(current_user_id)
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     exam_results = ExamResult.query.filter_by(user_id=user_id, level_id=level_id).all()
+    exam_payloads = (
+        PayloadStore.load_exam_payloads(exam.id for exam in exam_results)
+        if _include_payload()
+        else None
+    )
 
-    results = [
-        {
+    results = []
+    for exam in exam_results:
+        exam_data = {
             "user_id": exam.user_id,
             "level_id": exam.level_id,
             "percentage": exam.percentage,
             "type": exam.type,
-            "speechace_response": json.loads(exam.speechace_response) if exam.speechace_response else {},
-            "timestamp": exam.timestamp.isoformat(),
         }
-        for exam in exam_results
-    ]
+        if exam_payloads is not None:
+            exam_data["speechace_response"] = exam_payloads.get(exam.id, {})
+        exam_data["timestamp"] = exam.timestamp.isoformat()
+        results.append(exam_data)
 
     return LocalizationHelper.get_success_response(
         "operation_successful", {"exam_results": results}, lang, status_code=200
     )
 # Report Route
-@bp.route("/report", methods=["GET"])
-@client_required
-def get_user_report():
-    current_user_id = int(get_jwt_identity())
-    lang = ValidationHelper.get_language_from_request()
-    user = User.query.get(current_user_id)
-    if not user:
-        return LocalizationHelper.get_error_response("user_not_found", lang, 404)
-
+def _build_user_report(user, include_payload):
+    """Helper function to assemble the progress report of a user"""
     user_data = {
         "id": user.id,
         "name": user.name,
@@ -1675,56 +1940,57 @@ def get_user_report():
         "picture": user.picture or "Not set",
     }
 
-    user_levels = UserLevel.query.filter_by(user_id=current_user_id).all()
+    # The whole report is assembled from a fixed set of bulk queries, so its
+    # cost does not depend on how many levels or answers the user has
+    catalog = CatalogCache.get_catalog()
+    user_levels = (
+        UserLevel.query.filter_by(user_id=user.id)
+        .order_by(UserLevel.id)
+        .all()
+    )
+    level_ids = [user_level.level_id for user_level in user_levels]
+    progress_by_user_level = ProgressLoader.load_progress_by_user_level(
+        [user_level.id for user_level in user_levels]
+    )
+    answers_by_question = ProgressLoader.load_answers(
+        user.id,
+        [
+            question.id
+            for progress_rows in progress_by_user_level.values()
+            for progress in progress_rows
+            for question in catalog.questions_for_video(progress.video_id)
+        ],
+    )
+    exams_by_level = ProgressLoader.load_exam_results(user.id, level_ids)
+    answer_payloads = (
+        _load_answer_payloads(answers_by_question) if include_payload else None
+    )
+    exam_payloads = (
+        PayloadStore.load_exam_payloads(
+            exam.id for exams in exams_by_level.values() for exam in exams
+        )
+        if include_payload
+        else None
+    )
     levels_data = []
 
     for user_level in user_levels:
-        level = user_level.level
-        videos_progress = UserVideoProgress.query.filter_by(
-            user_level_id=user_level.id
-        ).all()
+        level = catalog.get_level(user_level.level_id)
         videos_data = []
 
-        for progress in videos_progress:
-            video = Video.query.get(progress.video_id)
-            questions = (
-                Question.query.filter_by(video_id=video.id)
-                .order_by(Question.order)
-                .all()
-            )
+        for progress in progress_by_user_level[user_level.id]:
+            video = catalog.get_video(progress.video_id)
             questions_data = []
 
-            for question in questions:
-                user_answer = UserQuestionAnswer.query.filter_by(
-                    user_id=current_user_id, question_id=question.id
-                ).first()
+            for question in catalog.questions_for_video(video.id):
+                user_answer = answers_by_question.get(question.id)
 
                 question_data = {
                     "question_id": question.id,
                     "question_text": question.text,
                     "question_order": question.order,
                 }
-
-                if user_answer:
-                    question_data.update(
-                        {
-                            "percentage": user_answer.percentage,
-                            "speechace_response": (
-                                json.loads(user_answer.speechace_response)
-                                if user_answer.speechace_response
-                                else {}
-                            ),
-                            "submitted_at": user_answer.submitted_at.isoformat(),
-                        }
-                    )
-                else:
-                    question_data.update(
-                        {
-                            "percentage": None,
-                            "speechace_response": {},
-                            "submitted_at": None,
-                        }
-                    )
+                question_data.update(_format_user_answer(user_answer, answer_payloads))
 
                 questions_data.append(question_data)
 
@@ -1740,24 +2006,17 @@ def get_user_report():
                 }
             )
 
-        exams = ExamResult.query.filter_by(
-            user_id=current_user_id, level_id=level.id
-        ).all()
         exams_data = []
 
-        for exam in exams:
-            exams_data.append(
-                {
-                    "type": exam.type,
-                    "percentage": exam.percentage,
-                    "speechace_response": (
-                        json.loads(exam.speechace_response)
-                        if exam.speechace_response
-                        else {}
-                    ),
-                    "timestamp": exam.timestamp.isoformat(),
-                }
-            )
+        for exam in exams_by_level[level.id]:
+            exam_data = {
+                "type": exam.type,
+                "percentage": exam.percentage,
+            }
+            if exam_payloads is not None:
+                exam_data["speechace_response"] = exam_payloads.get(exam.id, {})
+            exam_data["timestamp"] = exam.timestamp.isoformat()
+            exams_data.append(exam_data)
 
         level_data = {
             "level_id": level.id,
@@ -1774,10 +2033,92 @@ def get_user_report():
         }
         levels_data.append(level_data)
 
-    report = {"user": user_data, "levels": levels_data}
+    return {"user": user_data, "levels": levels_data}
+
+
+@bp.route("/report", methods=["GET"])
+@client_required
+def get_user_report():
+    lang = ValidationHelper.get_language_from_request()
+    user = get_current_user()
+    if not user:
+        return LocalizationHelper.get_error_response("user_not_found", lang, 404)
+
+    report = _build_user_report(user, _include_payload())
     return LocalizationHelper.get_success_response(
         "operation_successful", report, lang, status_code=200
     )
+
+
+@bp.route("/report.pdf", methods=["GET"])
+@client_required
+def get_user_report_pdf():
+    """The progress report as a PDF, rendered off the request thread.
+
+    The file is cached on disk until the user's progress, the catalog or the
+    user's details change, so repeated downloads are a plain file send.
+    """
+    lang = ValidationHelper.get_language_from_request()
+    user = get_current_user()
+    if not user:
+        return LocalizationHelper.get_error_response("user_not_found", lang, 404)
+
+    key = ReportCache.get_key(
+        user, ProgressVersions.get(user.id), CatalogCache.get_version()
+    )
+    try:
+        path = ReportCache.get_or_render(
+            user.id, key, lambda: _build_user_report(user, include_payload=False)
+        )
+    except Exception:
+        current_app.logger.exception("Rendering the report of user %s failed", user.id)
+        return LocalizationHelper.get_error_response("rendering_failed", lang, 500)
+    if path is None:
+        return LocalizationHelper.get_error_response("server_busy", lang, 503)
+
+    return send_file(
+        path,
+        mimetype="application/pdf",
+        download_name=f"progress-report-{user.id}.pdf",
+        max_age=0,
+    )
+
+
+@bp.route("/users/<int:user_id>/charts/<chart>.<fmt>", methods=["GET"])
+@client_required
+def get_user_chart(user_id, chart, fmt):
+    """A chart of the user's scores as PNG or SVG.
+
+    ``chart`` is ``video_scores`` or ``exam_scores``. Images are cached by
+    a hash of the data they show, which also serves as their ETag.
+    """
+    current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
+    lang = ValidationHelper.get_language_from_request()
+
+    if current_role != "admin" and current_user_id != user_id:
+        return LocalizationHelper.get_error_response("access_denied", lang, 403)
+    if chart not in CHART_DRAWERS or fmt not in CHART_FORMATS:
+        return LocalizationHelper.get_error_response("not_found", lang, 404)
+
+    data = getattr(ChartData, chart)(user_id)
+    key = ChartCache.get_key(chart, data, fmt)
+    not_modified = _not_modified_or_none(key)
+    if not_modified:
+        return not_modified
+
+    try:
+        image = ChartCache.get_or_render(chart, data, fmt, key)
+    except Exception:
+        current_app.logger.exception("Rendering chart %s of user %s failed", chart, user_id)
+        return LocalizationHelper.get_error_response("rendering_failed", lang, 500)
+    if image is None:
+        return LocalizationHelper.get_error_response("server_busy", lang, 503)
+
+    response = make_response(image)
+    response.mimetype = CHART_FORMATS[fmt]
+    response.headers.update(_etag_headers(key))
+    return response
 # Get User Levels Route
 # Update get_user_levels route:
 
@@ -1785,24 +2126,42 @@ def get_user_report():
 @client_required
 def get_user_levels(user_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
-    user = User.query.get(current_user_id)
 
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
-    user_levels = UserLevel.query.filter_by(user_id=user_id).all()
+    catalog = CatalogCache.get_catalog()
+    user_levels = (
+        UserLevel.query.filter_by(user_id=user_id).order_by(UserLevel.id).all()
+    )
+
+    # Prefetch all progress rows and answers in bulk instead of querying
+    # per video and per question
+    progress_by_video = ProgressLoader.load_video_progress(
+        [user_level.id for user_level in user_levels]
+    )
+    answers_by_question = ProgressLoader.load_answers(
+        user_id,
+        [
+            question.id
+            for user_level in user_levels
+            for video in catalog.videos_for_level(user_level.level_id)
+            for question in catalog.questions_for_video(video.id)
+        ],
+    )
+    answer_payloads = _load_answer_payloads(answers_by_question)
     result = []
 
     for user_level in user_levels:
-        level = user_level.level
+        level = catalog.get_level(user_level.level_id)
+        level_videos = catalog.videos_for_level(level.id)
         completed_videos_count = 0
         videos = []
 
-        for video in level.videos:
-            video_progress = UserVideoProgress.query.filter_by(
-                user_level_id=user_level.id, video_id=video.id
-            ).first()
+        for video in level_videos:
+            video_progress = progress_by_video.get((user_level.id, video.id))
 
             is_opened = video_progress.is_opened if video_progress else False
             is_completed = video_progress.is_completed if video_progress else False
@@ -1810,37 +2169,17 @@ def get_user_levels(user_id):
                 completed_videos_count += 1
 
             questions_data = []
-            if user.role == "admin" or is_opened:
-                questions = (
-                    Question.query.filter_by(video_id=video.id)
-                    .order_by(Question.order)
-                    .all()
-                )
-                for question in questions:
-                    user_answer = UserQuestionAnswer.query.filter_by(
-                        user_id=user_id, question_id=question.id
-                    ).first()
+            if current_role == "admin" or is_opened:
+                for question in catalog.questions_for_video(video.id):
                     question_data = {
                         "id": question.id,
                         "order": question.order,
                         "text": question.text,
+                        "user_answer": _format_user_answer(
+                            answers_by_question.get(question.id),
+                            answer_payloads,
+                        ),
                     }
-                    if user_answer:
-                        question_data["user_answer"] = {
-                            "percentage": user_answer.percentage,
-                            "speechace_response": (
-                                json.loads(user_answer.speechace_response)
-                                if user_answer.speechace_response
-                                else {}
-                            ),
-                            "submitted_at": user_answer.submitted_at.isoformat(),
-                        }
-                    else:
-                        question_data["user_answer"] = {
-                            "percentage": None,
-                            "speechace_response": {},
-                            "submitted_at": None,
-                        }
                     questions_data.append(question_data)
 
             video_data = {
@@ -1848,7 +2187,7 @@ def get_user_levels(user_id):
                 "name": video.name,
                 "order": video.order,
                 "youtube_link": (
-                    video.youtube_link if user.role == "admin" or is_opened else ""
+                    video.youtube_link if current_role == "admin" or is_opened else ""
                 ),
                 "is_opened": is_opened,
                 "is_completed": is_completed,
@@ -1862,7 +2201,7 @@ def get_user_levels(user_id):
             "level_name": level.name,
             "level_number": level.level_number,
             "welcome_video_url": level.welcome_video_url,
-            "videos_count": len(level.videos),
+            "videos_count": len(level_videos),
             "completed_videos_count": completed_videos_count,
             "videos": videos,
             "is_completed": user_level.is_completed,
@@ -1882,10 +2221,10 @@ def get_user_levels(user_id):
 @client_required
 def purchase_level(user_id, level_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
 
-    user = User.query.get(current_user_id)
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     level = Level.query.get_or_404(level_id)
@@ -1908,22 +2247,13 @@ def purchase_level(user_id, level_id):
     db.session.add(user_level)
     db.session.flush()
 
-    level_videos = Video.query.filter_by(level_id=level_id).order_by(Video.id).all()
-
     try:
-        for i, video in enumerate(level_videos):
-            existing_progress = UserVideoProgress.query.filter_by(
-                user_level_id=user_level.id, video_id=video.id
-            ).first()
-            if not existing_progress:
-                video_progress = UserVideoProgress(
-                    user_level_id=user_level.id,
-                    video_id=video.id,
-                    is_opened=(i == 0),
-                    is_completed=False,
-                )
-                db.session.add(video_progress)
+        ProgressProvisioner.provision(
+            user_level.id, CatalogCache.get_catalog().video_sequence(level_id)
+        )
+        PlatformCounters.purchase_added(level_id)
 
+        ProgressVersions.bump(user_id)
         db.session.commit()
         return LocalizationHelper.get_success_response(
             "level_purchased_successfully", None, lang, status_code=201
@@ -1940,25 +2270,23 @@ def purchase_level(user_id, level_id):
 @client_required
 def update_level_progress(user_id, level_id):
     current_user_id = int(get_jwt_identity())
+    current_role = get_current_role()
     lang = ValidationHelper.get_language_from_request()
 
-    user = User.query.get(current_user_id)
-    if user.role != "admin" and current_user_id != user_id:
+    if current_role != "admin" and current_user_id != user_id:
         return LocalizationHelper.get_error_response("access_denied", lang, 403)
 
     user_level = UserLevel.query.filter_by(user_id=user_id, level_id=level_id).first()
     if not user_level:
         return LocalizationHelper.get_error_response("level_not_purchased", lang, 400)
 
-    completed_videos = UserVideoProgress.query.filter_by(
-        user_level_id=user_level.id, is_completed=True
-    ).count()
-
-    total_videos = Video.query.filter_by(level_id=level_id).count()
+    completed_videos = user_level.completed_videos_count
+    total_videos = len(CatalogCache.get_catalog().video_sequence(level_id))
 
     if completed_videos == total_videos:
         user_level.can_take_final_exam = True
 
+    ProgressVersions.bump(user_id)
     db.session.commit()
 
     response_data = {
@@ -1976,27 +2304,21 @@ def update_level_progress(user_id, level_id):
 @admin_required
 def get_admin_statistics():
     lang = ValidationHelper.get_language_from_request()
-    total_users = User.query.filter_by(role="client").count()
-    total_levels = Level.query.count()
-    total_purchases = UserLevel.query.count()
-    completed_levels = UserLevel.query.filter_by(is_completed=True).count()
+
+    # Counters are maintained by the write routes, so no table is scanned here
+    stats = PlatformCounters.get()
+    total_purchases = stats.total_purchases
+    completed_levels = stats.completed_levels
 
     completion_rate = (
         (completed_levels / total_purchases * 100) if total_purchases > 0 else 0
     )
 
-    popular_levels = (
-        db.session.query(Level.name, db.func.count(UserLevel.id).label("purchases"))
-        .join(UserLevel)
-        .group_by(Level.id)
-        .order_by(db.desc("purchases"))
-        .limit(5)
-        .all()
-    )
+    popular_levels = PlatformCounters.popular_levels(5)
 
     response_data = {
-        "total_users": total_users,
-        "total_levels": total_levels,
+        "total_users": stats.total_users,
+        "total_levels": stats.total_levels,
         "total_purchases": total_purchases,
         "completed_levels": completed_levels,
         "completion_rate": round(completion_rate, 2),
@@ -2014,54 +2336,71 @@ def get_admin_statistics():
 @admin_required
 def get_user_statistics(user_id):
     lang = ValidationHelper.get_language_from_request()
-    user = User.query.get_or_404(user_id)
 
-    purchased_levels = UserLevel.query.filter_by(user_id=user_id).count()
-    completed_levels = UserLevel.query.filter_by(
-        user_id=user_id, is_completed=True
-    ).count()
+    response_data = UserStatistics.load([user_id]).get(user_id)
+    if response_data is None:
+        abort(404)
 
-    exam_results = ExamResult.query.filter_by(user_id=user_id).all()
+    return LocalizationHelper.get_success_response(
+        "operation_successful", response_data, lang, status_code=200
+    )
 
-    initial_scores = [
-        exam.percentage for exam in exam_results if exam.type == "initial"
-    ]
-    final_scores = [exam.percentage for exam in exam_results if exam.type == "final"]
 
-    avg_initial_score = (
-        sum(initial_scores) / len(initial_scores) if initial_scores else 0
-    )
-    avg_final_score = sum(final_scores) / len(final_scores) if final_scores else 0
-    avg_improvement = (
-        avg_final_score - avg_initial_score if initial_scores and final_scores else 0
-    )
+@bp.route("/admin/users/statistics", methods=["POST"])
+@admin_required
+def get_users_statistics():
+    """Statistics of many users computed in a single query.
 
-    total_questions_answered = UserQuestionAnswer.query.filter_by(
-        user_id=user_id
-    ).count()
-    avg_question_score = (
-        db.session.query(db.func.avg(UserQuestionAnswer.percentage))
-        .filter_by(user_id=user_id)
-        .scalar()
-        or 0
-    )
+    Ids of users that do not exist are listed in ``missing_user_ids``.
+    """
+    lang = ValidationHelper.get_language_from_request()
+    data = request.get_json(silent=True) or {}
+
+    user_ids = data.get("user_ids")
+    if not isinstance(user_ids, list) or not user_ids:
+        return LocalizationHelper.get_error_response(
+            "required_field", lang, 400, field="user_ids"
+        )
+    if not all(isinstance(user_id, int) for user_id in user_ids):
+        return LocalizationHelper.get_error_response(
+            "invalid_format", lang, 400, field="user_ids"
+        )
+    max_size = current_app.config["USER_STATISTICS_BATCH_MAX_SIZE"]
+    if len(user_ids) > max_size:
+        return LocalizationHelper.get_error_response(
+            "too_many_users", lang, 400, max=max_size
+        )
+
+    user_ids = list(dict.fromkeys(user_ids))
+    statistics = UserStatistics.load(user_ids)
 
     response_data = {
-        "user_id": user_id,
-        "user_name": user.name,
-        "purchased_levels": purchased_levels,
-        "completed_levels": completed_levels,
-        "completion_rate": round(
-            (completed_levels / purchased_levels * 100) if purchased_levels > 0 else 0,
-            2,
-        ),
-        "average_initial_score": round(avg_initial_score, 2),
-        "average_final_score": round(avg_final_score, 2),
-        "average_improvement": round(avg_improvement, 2),
-        "total_exams_taken": len(exam_results),
-        "total_questions_answered": total_questions_answered,
-        "average_question_score": round(avg_question_score, 2),
+        "users": [statistics[user_id] for user_id in user_ids if user_id in statistics],
+        "missing_user_ids": [
+            user_id for user_id in user_ids if user_id not in statistics
+        ],
     }
     return LocalizationHelper.get_success_response(
         "operation_successful", response_data, lang, status_code=200
     )
+
+
+@bp.route("/admin/analytics/cohorts", methods=["GET"])
+@admin_required
+def get_cohort_analytics():
+    """Score distributions, improvement and question difficulty per level.
+
+    Computed from all users' data and cached for COHORT_ANALYTICS_MAX_AGE
+    seconds, or until the catalog changes.
+    """
+    lang = ValidationHelper.get_language_from_request()
+    version = CohortAnalytics.get_version()
+    etag = hashlib.sha256(json.dumps([version, lang]).encode("utf-8")).hexdigest()
+    not_modified = _not_modified_or_none(etag)
+    if not_modified:
+        return not_modified
+
+    response, status_code = LocalizationHelper.get_success_response(
+        "operation_successful", CohortAnalytics.get(version), lang, status_code=200
+    )
+    return response, status_code, _etag_headers(etag)
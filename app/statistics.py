@@ -0,0 +1,291 @@
+from app import db
+from app.models import (
+    ExamResult,
+    Level,
+    LevelStatistics,
+    PlatformStatistics,
+    User,
+    UserLevel,
+    UserQuestionAnswer,
+)
+
+
+class PlatformCounters:
+    """Helper class for the counters behind /admin/statistics.
+
+    Routes that add or remove users, levels, purchases or completions call
+    the matching method in the same transaction as their change. Every
+    update is a single relative UPDATE, so concurrent requests never lose
+    increments, and the dashboard reads two small rows instead of counting
+    whole tables. ``rebuild`` recomputes everything from the source tables.
+    """
+
+    @staticmethod
+    def _add(**deltas):
+        PlatformStatistics.query.filter_by(id=1).update(
+            {
+                getattr(PlatformStatistics, name): getattr(PlatformStatistics, name) + delta
+                for name, delta in deltas.items()
+            },
+            synchronize_session=False,
+        )
+
+    @staticmethod
+    def _add_to_level(level_id, **deltas):
+        LevelStatistics.query.filter_by(level_id=level_id).update(
+            {
+                getattr(LevelStatistics, name): getattr(LevelStatistics, name) + delta
+                for name, delta in deltas.items()
+            },
+            synchronize_session=False,
+        )
+
+    @staticmethod
+    def user_added(role):
+        if role == "client":
+            PlatformCounters._add(total_users=1)
+
+    @staticmethod
+    def user_role_changed(old_role, new_role):
+        if old_role != new_role and "client" in (old_role, new_role):
+            PlatformCounters._add(total_users=1 if new_role == "client" else -1)
+
+    @staticmethod
+    def user_removed(user_id, role):
+        """Discount a user and their enrollments. Call before deleting them."""
+        enrollments = (
+            db.session.query(
+                UserLevel.level_id,
+                db.func.count(UserLevel.id),
+                db.func.count(UserLevel.id).filter(UserLevel.is_completed.is_(True)),
+            )
+            .filter(UserLevel.user_id == user_id)
+            .group_by(UserLevel.level_id)
+            .all()
+        )
+        for level_id, purchases, completions in enrollments:
+            PlatformCounters._add_to_level(
+                level_id, purchases=-purchases, completions=-completions
+            )
+        PlatformCounters._add(
+            total_users=-1 if role == "client" else 0,
+            total_purchases=-sum(purchases for _, purchases, _ in enrollments),
+            completed_levels=-sum(completions for _, _, completions in enrollments),
+            enrollment_version=1 if enrollments else 0,
+        )
+
+    @staticmethod
+    def level_added(level_id):
+        db.session.add(LevelStatistics(level_id=level_id, purchases=0, completions=0))
+        PlatformCounters._add(total_levels=1)
+
+    @staticmethod
+    def level_removed(level_id):
+        """Discount a level and its enrollments. Call before deleting it."""
+        level_stats = db.session.get(LevelStatistics, level_id)
+        purchases = level_stats.purchases if level_stats else 0
+        completions = level_stats.completions if level_stats else 0
+        LevelStatistics.query.filter_by(level_id=level_id).delete(synchronize_session=False)
+        PlatformCounters._add(
+            total_levels=-1,
+            total_purchases=-purchases,
+            completed_levels=-completions,
+            enrollment_version=1 if purchases else 0,
+        )
+
+    @staticmethod
+    def purchase_added(level_id):
+        PlatformCounters._add_to_level(level_id, purchases=1)
+        PlatformCounters._add(total_purchases=1, enrollment_version=1)
+
+    @staticmethod
+    def complete_level(user_level):
+        """Mark a purchased level completed, counting it only the first time.
+
+        The flag is flipped by a conditional UPDATE so that concurrent or
+        repeated final exams cannot count the same level twice.
+        """
+        completed_now = UserLevel.query.filter_by(
+            id=user_level.id, is_completed=False
+        ).update({UserLevel.is_completed: True}, synchronize_session=False)
+        user_level.is_completed = True
+        if completed_now:
+            PlatformCounters._add_to_level(user_level.level_id, completions=1)
+            PlatformCounters._add(completed_levels=1)
+
+    @staticmethod
+    def get():
+        """Return the platform totals.
+
+        The row is seeded together with its table, so this only reads; a
+        database that somehow lacks it shows zeros until
+        ``flask rebuild-statistics`` runs.
+        """
+        stats = db.session.get(PlatformStatistics, 1)
+        if stats is None:
+            stats = PlatformStatistics(
+                id=1, total_users=0, total_levels=0, total_purchases=0, completed_levels=0
+            )
+        return stats
+
+    @staticmethod
+    def get_enrollment_version():
+        """Return a version that moves on whenever enrollments change"""
+        version = (
+            db.session.query(PlatformStatistics.enrollment_version)
+            .filter_by(id=1)
+            .scalar()
+        )
+        return version or 0
+
+    @staticmethod
+    def popular_levels(limit):
+        """Return [(level name, purchases)] of the most purchased levels"""
+        return (
+            db.session.query(Level.name, LevelStatistics.purchases)
+            .join(Level, Level.id == LevelStatistics.level_id)
+            .filter(LevelStatistics.purchases > 0)
+            .order_by(LevelStatistics.purchases.desc(), LevelStatistics.level_id)
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def rebuild():
+        """Recompute every counter from the source tables, returning the level count"""
+        LevelStatistics.query.delete(synchronize_session=False)
+        level_rows = (
+            db.session.query(
+                Level.id,
+                db.func.count(UserLevel.id),
+                db.func.count(UserLevel.id).filter(UserLevel.is_completed.is_(True)),
+            )
+            .outerjoin(UserLevel, UserLevel.level_id == Level.id)
+            .group_by(Level.id)
+            .all()
+        )
+        if level_rows:
+            db.session.execute(
+                db.insert(LevelStatistics),
+                [
+                    {"level_id": level_id, "purchases": purchases, "completions": completions}
+                    for level_id, purchases, completions in level_rows
+                ],
+            )
+
+        totals = {
+            "total_users": User.query.filter_by(role="client").count(),
+            "total_levels": len(level_rows),
+            "total_purchases": UserLevel.query.count(),
+            "completed_levels": UserLevel.query.filter_by(is_completed=True).count(),
+        }
+        # Enrollments may have been edited by hand, so cached views are dropped
+        updated = PlatformStatistics.query.filter_by(id=1).update(
+            {
+                **totals,
+                "enrollment_version": PlatformStatistics.enrollment_version + 1,
+            },
+            synchronize_session=False,
+        )
+        if not updated:
+            db.session.add(PlatformStatistics(id=1, **totals))
+        return len(level_rows)
+
+
+class UserStatistics:
+    """Helper class for computing per-user learning statistics in SQL.
+
+    Enrollments, exam results and answers are each aggregated per user in a
+    grouped subquery and joined onto the users in a single statement, so no
+    result rows, let alone SpeechAce payloads, are loaded into Python.
+    """
+
+    @staticmethod
+    def load(user_ids):
+        """Return {user_id: statistics dict} for the users that exist"""
+        if not user_ids:
+            return {}
+
+        levels = (
+            db.select(
+                UserLevel.user_id,
+                db.func.count(UserLevel.id).label("purchased"),
+                db.func.count(UserLevel.id)
+                .filter(UserLevel.is_completed.is_(True))
+                .label("completed"),
+            )
+            .where(UserLevel.user_id.in_(user_ids))
+            .group_by(UserLevel.user_id)
+            .subquery()
+        )
+        exams = (
+            db.select(
+                ExamResult.user_id,
+                db.func.count(ExamResult.id).label("taken"),
+                db.func.avg(ExamResult.percentage)
+                .filter(ExamResult.type == "initial")
+                .label("avg_initial"),
+                db.func.avg(ExamResult.percentage)
+                .filter(ExamResult.type == "final")
+                .label("avg_final"),
+            )
+            .where(ExamResult.user_id.in_(user_ids))
+            .group_by(ExamResult.user_id)
+            .subquery()
+        )
+        answers = (
+            db.select(
+                UserQuestionAnswer.user_id,
+                db.func.count(UserQuestionAnswer.id).label("answered"),
+                db.func.avg(UserQuestionAnswer.percentage).label("avg_score"),
+            )
+            .where(UserQuestionAnswer.user_id.in_(user_ids))
+            .group_by(UserQuestionAnswer.user_id)
+            .subquery()
+        )
+
+        rows = db.session.execute(
+            db.select(
+                User.id,
+                User.name,
+                levels.c.purchased,
+                levels.c.completed,
+                exams.c.taken,
+                exams.c.avg_initial,
+                exams.c.avg_final,
+                answers.c.answered,
+                answers.c.avg_score,
+            )
+            .outerjoin(levels, levels.c.user_id == User.id)
+            .outerjoin(exams, exams.c.user_id == User.id)
+            .outerjoin(answers, answers.c.user_id == User.id)
+            .where(User.id.in_(user_ids))
+        )
+        return {row.id: UserStatistics._to_dict(row) for row in rows}
+
+    @staticmethod
+    def _to_dict(row):
+        purchased = row.purchased or 0
+        completed = row.completed or 0
+        avg_initial = row.avg_initial or 0
+        avg_final = row.avg_final or 0
+        avg_improvement = (
+            avg_final - avg_initial
+            if row.avg_initial is not None and row.avg_final is not None
+            else 0
+        )
+        return {
+            "user_id": row.id,
+            "user_name": row.name,
+            "purchased_levels": purchased,
+            "completed_levels": completed,
+            "completion_rate": round(
+                (completed / purchased * 100) if purchased > 0 else 0, 2
+            ),
+            "average_initial_score": round(avg_initial, 2),
+            "average_final_score": round(avg_final, 2),
+            "average_improvement": round(avg_improvement, 2),
+            "total_exams_taken": row.taken or 0,
+            "total_questions_answered": row.answered or 0,
+            "average_question_score": round(row.avg_score or 0, 2),
+        }
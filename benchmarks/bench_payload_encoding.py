@@ -0,0 +1,118 @@
+"""Benchmark how stored SpeechAce payloads reach a JSON response.
+
+Compares parsing every payload and encoding it again (the old read path)
+with splicing the stored JSON text into the response through RawJSON.
+
+Run from the project root:
+
+    python benchmarks/bench_payload_encoding.py [--answers 50] [--words 300]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.encoding import RawJSON, RawJSONProvider
+from app.payloads import PayloadStore
+
+
+def make_payload(words):
+    """A SpeechAce-like response with per-word, per-syllable and per-phone scores"""
+    word_scores = []
+    for i in range(words):
+        word_scores.append(
+            {
+                "word": f"word{i}",
+                "quality_score": 80 + i % 20,
+                "syllable_score_list": [
+                    {
+                        "letters": f"syl{j}",
+                        "quality_score": 70 + j,
+                        "stress_level": j % 2,
+                        "extent": [i * 10 + j, i * 10 + j + 5],
+                    }
+                    for j in range(2)
+                ],
+                "phone_score_list": [
+                    {
+                        "phone": f"p{k}",
+                        "quality_score": 60 + k,
+                        "sound_most_like": f"p{k}",
+                        "extent": [i * 10 + k, i * 10 + k + 2],
+                    }
+                    for k in range(4)
+                ],
+            }
+        )
+    return {
+        "status": "success",
+        "text_score": {
+            "text": " ".join(f"word{i}" for i in range(words)),
+            "word_score_list": word_scores,
+            "speechace_score": {"pronunciation": 87.5, "fluency": 80.0},
+            "ielts_score": {"pronunciation": 7.5},
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=50, help="payloads per response")
+    parser.add_argument("--words", type=int, default=300, help="words per payload")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    raw_provider = RawJSONProvider(app)
+
+    payload = make_payload(args.words)
+    stored = [PayloadStore.compress(PayloadStore.encode(payload)) for _ in range(args.answers)]
+    payload_size = len(PayloadStore.encode(payload))
+
+    def response(payloads):
+        return {
+            "answers": [
+                {"id": i, "percentage": 87.5, "speechace_response": p}
+                for i, p in enumerate(payloads)
+            ]
+        }
+
+    def parse_and_reencode():
+        payloads = [json.loads(PayloadStore.decompress(codec, data).text) for codec, data in stored]
+        return default_provider.dumps(response(payloads), separators=(",", ":"))
+
+    def raw_splice():
+        payloads = [PayloadStore.decompress(codec, data) for codec, data in stored]
+        return raw_provider.dumps(response(payloads), separators=(",", ":"))
+
+    def submit_encode_twice():
+        stored_text = json.dumps(payload)
+        echoed = default_provider.dumps({"speechace_response": json.loads(stored_text)})
+        return stored_text, echoed
+
+    def submit_encode_once():
+        encoded = RawJSON(PayloadStore.encode(payload))
+        return encoded.text, raw_provider.dumps({"speechace_response": encoded})
+
+    assert json.loads(parse_and_reencode()) == json.loads(raw_splice())
+
+    print(f"{args.answers} payloads of {payload_size / 1024:.1f} KiB per response, best of {args.repeat}")
+    for name, func in [
+        ("read: parse + re-encode", parse_and_reencode),
+        ("read: RawJSON splice", raw_splice),
+        ("submit: dumps/loads/dumps", submit_encode_twice),
+        ("submit: encode once", submit_encode_once),
+    ]:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"  {name:<28} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""add completed videos counter to user levels
+
+The model and routes started reading UserLevel.completed_videos_count
+before this revision was written, so that code must never be deployed
+against an existing database without this revision applied.
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-17 21:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created by db.create_all() after the counter was introduced
+    # already have the column
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('user_level')]
+    if 'completed_videos_count' in columns:
+        return
+
+    with op.batch_alter_table('user_level') as batch_op:
+        batch_op.add_column(sa.Column('completed_videos_count', sa.Integer(), nullable=False, server_default='0'))
+
+    op.execute(
+        'UPDATE user_level SET completed_videos_count = ('
+        'SELECT COUNT(*) FROM user_video_progress '
+        'WHERE user_video_progress.user_level_id = user_level.id '
+        'AND user_video_progress.is_completed = TRUE)'
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('user_level') as batch_op:
+        batch_op.drop_column('completed_videos_count')
@@ -0,0 +1,100 @@
+"""unique constraints and composite indexes on progress tables
+
+Revision ID: 8a4e6d2c1b53
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4e6d2c1b53'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+
+UNIQUE_CONSTRAINTS = [
+    ('user_video_progress', 'uq_user_level_video', ['user_level_id', 'video_id']),
+    ('user_question_answer', 'uq_user_question', ['user_id', 'question_id']),
+]
+
+INDEXES = [
+    ('user_level', 'ix_user_level_user_level', ['user_id', 'level_id']),
+    ('exam_result', 'ix_exam_result_user_level', ['user_id', 'level_id']),
+    ('video', 'ix_video_level_order', ['level_id', 'order']),
+    ('question', 'ix_question_video_order', ['video_id', 'order']),
+]
+
+
+def _merge_duplicate_progress():
+    """Keep the oldest progress row per (user_level, video), carrying over
+    any opened/completed flag set on one of its duplicates"""
+    op.execute(
+        'UPDATE user_video_progress SET '
+        'is_opened = EXISTS (SELECT 1 FROM user_video_progress d '
+        'WHERE d.user_level_id = user_video_progress.user_level_id '
+        'AND d.video_id = user_video_progress.video_id AND d.is_opened = TRUE), '
+        'is_completed = EXISTS (SELECT 1 FROM user_video_progress d '
+        'WHERE d.user_level_id = user_video_progress.user_level_id '
+        'AND d.video_id = user_video_progress.video_id AND d.is_completed = TRUE) '
+        'WHERE id IN (SELECT MIN(id) FROM user_video_progress '
+        'GROUP BY user_level_id, video_id HAVING COUNT(*) > 1)'
+    )
+    op.execute(
+        'DELETE FROM user_video_progress WHERE id NOT IN ('
+        'SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM user_video_progress '
+        'GROUP BY user_level_id, video_id) AS keep)'
+    )
+    # Completions of removed duplicates may have been counted twice
+    op.execute(
+        'UPDATE user_level SET completed_videos_count = ('
+        'SELECT COUNT(*) FROM user_video_progress '
+        'WHERE user_video_progress.user_level_id = user_level.id '
+        'AND user_video_progress.is_completed = TRUE)'
+    )
+
+
+def _remove_duplicate_answers():
+    """Keep only the newest answer per (user, question)"""
+    op.execute(
+        'DELETE FROM user_question_answer WHERE id NOT IN ('
+        'SELECT keep_id FROM (SELECT MAX(id) AS keep_id FROM user_question_answer '
+        'GROUP BY user_id, question_id) AS keep)'
+    )
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    # Tables created by db.create_all() from the current models already
+    # have everything; older databases never got the constraints because the
+    # models declared _table_args_ instead of __table_args__
+    existing_constraints = {
+        table: {constraint['name'] for constraint in inspector.get_unique_constraints(table)}
+        for table, _, _ in UNIQUE_CONSTRAINTS
+    }
+    if 'uq_user_level_video' not in existing_constraints['user_video_progress']:
+        _merge_duplicate_progress()
+    if 'uq_user_question' not in existing_constraints['user_question_answer']:
+        _remove_duplicate_answers()
+
+    for table, name, columns in UNIQUE_CONSTRAINTS:
+        if name not in existing_constraints[table]:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.create_unique_constraint(name, columns)
+
+    for table, name, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for table, name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+
+    for table, name, _ in reversed(UNIQUE_CONSTRAINTS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(name, type_='unique')
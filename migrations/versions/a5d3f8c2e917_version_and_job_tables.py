@@ -0,0 +1,60 @@
+"""catalog and progress version tables, background jobs
+
+Revision ID: a5d3f8c2e917
+Revises: e4d91b07a3c6
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5d3f8c2e917'
+down_revision = 'e4d91b07a3c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('catalog_version'):
+        op.create_table(
+            'catalog_version',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('version', sa.Integer(), nullable=False),
+        )
+
+    # CatalogCache.bump_version only updates this row, so it must exist
+    # before the app serves its first admin write
+    op.execute(
+        "INSERT INTO catalog_version (id, version) "
+        "SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM catalog_version WHERE id = 1)"
+    )
+
+    if not inspector.has_table('user_progress_version'):
+        op.create_table(
+            'user_progress_version',
+            sa.Column('user_id', sa.Integer(), sa.ForeignKey('user.id'), primary_key=True),
+            sa.Column('version', sa.Integer(), nullable=False),
+        )
+
+    if not inspector.has_table('background_job'):
+        op.create_table(
+            'background_job',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('job_type', sa.String(length=50), nullable=False),
+            sa.Column('status', sa.String(length=20), nullable=False),
+            sa.Column('total', sa.Integer(), nullable=False),
+            sa.Column('processed', sa.Integer(), nullable=False),
+            sa.Column('error', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('finished_at', sa.DateTime(), nullable=True),
+        )
+
+
+def downgrade():
+    op.drop_table('background_job')
+    op.drop_table('user_progress_version')
+    op.drop_table('catalog_version')
@@ -0,0 +1,33 @@
+"""drop the global progress data version row
+
+Cohort analytics are now cached for a fixed period instead, so progress
+writes no longer update one row shared by all users.
+
+Revision ID: a9c4e2f7b318
+Revises: f1b6e3d8a527
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c4e2f7b318'
+down_revision = 'f1b6e3d8a527'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if sa.inspect(op.get_bind()).has_table('progress_data_version'):
+        op.drop_table('progress_data_version')
+
+
+def downgrade():
+    op.create_table(
+        'progress_data_version',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+    )
+    op.execute("INSERT INTO progress_data_version (id, version) VALUES (1, 0)")
@@ -0,0 +1,35 @@
+"""indexes for the per-video and per-question admin counts
+
+Revision ID: b8e2c6a4d301
+Revises: a5d3f8c2e917
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e2c6a4d301'
+down_revision = 'a5d3f8c2e917'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('user_video_progress', 'ix_user_video_progress_video', ['video_id']),
+    ('user_question_answer', 'ix_user_question_answer_question', ['question_id', 'id']),
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, name, columns in INDEXES:
+        if name not in {index['name'] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for table, name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
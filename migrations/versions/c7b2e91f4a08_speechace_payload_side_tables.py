@@ -0,0 +1,43 @@
+"""compressed side tables for SpeechAce payloads
+
+Revision ID: c7b2e91f4a08
+Revises: 8a4e6d2c1b53
+Create Date: 2026-10-17 22:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7b2e91f4a08'
+down_revision = '8a4e6d2c1b53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing payloads stay in the legacy columns until
+    # `flask backfill-payloads` moves them in batches
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('user_question_answer_payload'):
+        op.create_table(
+            'user_question_answer_payload',
+            sa.Column('answer_id', sa.Integer(), sa.ForeignKey('user_question_answer.id'), primary_key=True),
+            sa.Column('codec', sa.String(length=10), nullable=False),
+            sa.Column('data', sa.LargeBinary(), nullable=False),
+        )
+
+    if not inspector.has_table('exam_result_payload'):
+        op.create_table(
+            'exam_result_payload',
+            sa.Column('exam_result_id', sa.Integer(), sa.ForeignKey('exam_result.id'), primary_key=True),
+            sa.Column('codec', sa.String(length=10), nullable=False),
+            sa.Column('data', sa.LargeBinary(), nullable=False),
+        )
+
+
+def downgrade():
+    op.drop_table('exam_result_payload')
+    op.drop_table('user_question_answer_payload')
@@ -0,0 +1,35 @@
+"""single version row for all users' progress
+
+Revision ID: d4f7a2b9c815
+Revises: b8e2c6a4d301
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f7a2b9c815'
+down_revision = 'b8e2c6a4d301'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not sa.inspect(op.get_bind()).has_table('progress_data_version'):
+        op.create_table(
+            'progress_data_version',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('version', sa.Integer(), nullable=False),
+        )
+
+    # ProgressVersions.bump_data_version only updates this row
+    op.execute(
+        "INSERT INTO progress_data_version (id, version) "
+        "SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM progress_data_version WHERE id = 1)"
+    )
+
+
+def downgrade():
+    op.drop_table('progress_data_version')
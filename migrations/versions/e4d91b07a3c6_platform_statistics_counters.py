@@ -0,0 +1,66 @@
+"""incrementally maintained platform statistics counters
+
+Revision ID: e4d91b07a3c6
+Revises: c7b2e91f4a08
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4d91b07a3c6'
+down_revision = 'c7b2e91f4a08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('platform_statistics'):
+        op.create_table(
+            'platform_statistics',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('total_users', sa.Integer(), nullable=False),
+            sa.Column('total_levels', sa.Integer(), nullable=False),
+            sa.Column('total_purchases', sa.Integer(), nullable=False),
+            sa.Column('completed_levels', sa.Integer(), nullable=False),
+        )
+
+    if not inspector.has_table('level_statistics'):
+        op.create_table(
+            'level_statistics',
+            sa.Column('level_id', sa.Integer(), sa.ForeignKey('level.id'), primary_key=True),
+            sa.Column('purchases', sa.Integer(), nullable=False),
+            sa.Column('completions', sa.Integer(), nullable=False),
+        )
+        op.create_index('ix_level_statistics_purchases', 'level_statistics', ['purchases'])
+
+    # The counters start out matching the existing data. The app only ever
+    # updates the platform row, so it has to exist before the app starts.
+    op.execute(
+        'INSERT INTO platform_statistics '
+        '(id, total_users, total_levels, total_purchases, completed_levels) '
+        'SELECT 1, '
+        '(SELECT COUNT(*) FROM "user" WHERE role = \'client\'), '
+        '(SELECT COUNT(*) FROM level), '
+        '(SELECT COUNT(*) FROM user_level), '
+        '(SELECT COUNT(*) FROM user_level WHERE is_completed = TRUE) '
+        'WHERE NOT EXISTS (SELECT 1 FROM platform_statistics WHERE id = 1)'
+    )
+    op.execute(
+        'INSERT INTO level_statistics (level_id, purchases, completions) '
+        'SELECT level.id, COUNT(user_level.id), '
+        'COUNT(CASE WHEN user_level.is_completed = TRUE THEN 1 END) '
+        'FROM level LEFT JOIN user_level ON user_level.level_id = level.id '
+        'WHERE NOT EXISTS (SELECT 1 FROM level_statistics WHERE level_id = level.id) '
+        'GROUP BY level.id'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_level_statistics_purchases', table_name='level_statistics')
+    op.drop_table('level_statistics')
+    op.drop_table('platform_statistics')
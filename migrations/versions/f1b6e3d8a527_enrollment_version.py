@@ -0,0 +1,30 @@
+"""enrollment version on the platform statistics row
+
+Revision ID: f1b6e3d8a527
+Revises: d4f7a2b9c815
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b6e3d8a527'
+down_revision = 'd4f7a2b9c815'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('platform_statistics')]
+    if 'enrollment_version' in columns:
+        return
+
+    with op.batch_alter_table('platform_statistics') as batch_op:
+        batch_op.add_column(sa.Column('enrollment_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('platform_statistics') as batch_op:
+        batch_op.drop_column('enrollment_version')
@@ -0,0 +1,69 @@
+import contextlib
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app, db
+from app.auth import create_user_token
+from app.config import Config
+from app.models import User
+
+
+@pytest.fixture
+def app(tmp_path):
+    class TestConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        UPLOAD_FOLDER = str(tmp_path / "Uploads" / "levels")
+        PROFILE_UPLOAD_FOLDER = str(tmp_path / "Uploads" / "profiles")
+        REPORT_CACHE_FOLDER = str(tmp_path / "cache" / "reports")
+        CHART_CACHE_FOLDER = str(tmp_path / "cache" / "charts")
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    """Create a user and return (user id, request headers with their token)"""
+
+    def make_user(role="client", name="user"):
+        user = User(
+            name=name,
+            email=f"{name}-{role}@example.com",
+            password="not-used",
+            role=role,
+        )
+        db.session.add(user)
+        db.session.commit()
+        return user.id, {"Authorization": f"Bearer {create_user_token(user)}"}
+
+    return make_user
+
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager collecting the SQL statements executed inside it"""
+
+    @contextlib.contextmanager
+    def count_queries():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+    return count_queries
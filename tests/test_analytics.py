@@ -0,0 +1,49 @@
+import types
+
+import pytest
+
+from app import analytics, db
+from app.catalog import CatalogCache
+from app.models import Level, UserLevel
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable clock for the analytics cache period"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(analytics, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def cohort(client, headers):
+    response = client.get("/admin/analytics/cohorts", headers=headers)
+    assert response.status_code == 200
+    return response.json
+
+
+def test_cohort_analytics_are_cached_for_one_period(app, client, make_user, clock):
+    _, headers = make_user(role="admin", name="admin")
+    user_id, _ = make_user(name="client")
+    level = Level(name="Level 1", level_number=1, price=10.0)
+    db.session.add(level)
+    CatalogCache.bump_version()
+    db.session.commit()
+    assert cohort(client, headers)["levels"][0]["enrolled_users"] == 0
+
+    db.session.add(UserLevel(user_id=user_id, level_id=level.id))
+    db.session.commit()
+    # Progress writes invalidate nothing; the result may lag for one period
+    assert cohort(client, headers)["levels"][0]["enrolled_users"] == 0
+
+    clock[0] += app.config["COHORT_ANALYTICS_MAX_AGE"]
+    assert cohort(client, headers)["levels"][0]["enrolled_users"] == 1
+
+
+def test_cohort_analytics_follow_catalog_changes_at_once(client, make_user, clock):
+    _, headers = make_user(role="admin", name="admin")
+    assert cohort(client, headers)["levels"] == []
+
+    db.session.add(Level(name="Level 1", level_number=1, price=10.0))
+    CatalogCache.bump_version()
+    db.session.commit()
+    assert len(cohort(client, headers)["levels"]) == 1
@@ -0,0 +1,68 @@
+import pytest
+
+from app import db
+from app.bulk import BulkWriter
+from app.models import (
+    Level,
+    Question,
+    UserLevel,
+    UserQuestionAnswer,
+    UserVideoProgress,
+    Video,
+)
+from app.payloads import PayloadStore
+
+
+def speechace_response(pronunciation):
+    return {"text_score": {"speechace_score": {"pronunciation": pronunciation}}}
+
+
+@pytest.fixture(params=["on_conflict", "select_then_update"])
+def upsert_strategy(request, monkeypatch):
+    """Run a test with the native upsert and with the portable fallback"""
+    if request.param == "select_then_update":
+        monkeypatch.setattr(BulkWriter, "_dialect_insert", staticmethod(lambda model: None))
+    return request.param
+
+
+@pytest.fixture
+def opened_question(make_user):
+    """A question of an opened video in a level the client owns"""
+    user_id, headers = make_user()
+    level = Level(name="Level 1", level_number=1, price=10.0)
+    db.session.add(level)
+    db.session.flush()
+    video = Video(level_id=level.id, name="Video 1", youtube_link="https://youtu.be/1", order=1)
+    user_level = UserLevel(user_id=user_id, level_id=level.id)
+    db.session.add_all([video, user_level])
+    db.session.flush()
+    question = Question(video_id=video.id, text="Question 1", order=1)
+    db.session.add_all(
+        [
+            question,
+            UserVideoProgress(user_level_id=user_level.id, video_id=video.id, is_opened=True),
+        ]
+    )
+    db.session.commit()
+    return user_id, headers, question.id
+
+
+def test_resubmitting_overwrites_the_answer(client, opened_question, upsert_strategy):
+    user_id, headers, question_id = opened_question
+    url = f"/questions/{question_id}/submit"
+
+    first = client.post(url, json={"speechace_response": speechace_response(40)}, headers=headers)
+    second = client.post(url, json={"speechace_response": speechace_response(90)}, headers=headers)
+    assert first.status_code == second.status_code == 200
+    assert first.json["id"] == second.json["id"]
+    assert second.json["percentage"] == 90.0
+
+    db.session.expire_all()
+    answers = UserQuestionAnswer.query.filter_by(user_id=user_id, question_id=question_id).all()
+    assert len(answers) == 1
+    assert answers[0].id == first.json["id"]
+    assert answers[0].percentage == 90.0
+    payloads = PayloadStore.load_answer_payloads([answers[0].id])
+    assert PayloadStore.encode(payloads[answers[0].id]) == PayloadStore.encode(
+        speechace_response(90)
+    )
@@ -0,0 +1,8 @@
+def test_each_request_sees_its_own_user(client, make_user):
+    users = [make_user(name="first"), make_user(name="second")]
+
+    # The app fixture keeps one app context, and so one ``g``, across requests
+    for name, (_, headers) in [("first", users[0]), ("second", users[1])] * 2:
+        response = client.get("/report", headers=headers)
+        assert response.status_code == 200
+        assert response.json["user"]["email"] == f"{name}-client@example.com"
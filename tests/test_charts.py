@@ -0,0 +1,36 @@
+import os
+
+from app.charts import ChartCache
+
+
+def write_images(folder, names):
+    os.makedirs(folder, exist_ok=True)
+    for age, name in enumerate(reversed(names)):
+        path = os.path.join(folder, name)
+        with open(path, "wb") as image_file:
+            image_file.write(b"image")
+        os.utime(path, (1_000_000 - age, 1_000_000 - age))
+
+
+def test_pruning_keeps_the_newest_images_and_temporary_files(app, tmp_path):
+    app.config["CHART_DISK_CACHE_MAX_FILES"] = 2
+    folder = str(tmp_path / "charts")
+    write_images(folder, ["old.png", "older.tmp", "new.png", "newer.svg"])
+
+    ChartCache._prune_disk(folder)
+
+    # A .tmp file is another request's write in progress
+    assert sorted(os.listdir(folder)) == ["new.png", "newer.svg", "older.tmp"]
+
+
+def test_disk_cache_is_pruned_every_few_writes(app, tmp_path):
+    app.config["CHART_DISK_CACHE_MAX_FILES"] = 1
+    app.config["CHART_DISK_CACHE_PRUNE_EVERY"] = 3
+    folder = str(tmp_path / "charts")
+    write_images(folder, ["a.png", "b.png", "c.png"])
+
+    ChartCache._written(folder)
+    ChartCache._written(folder)
+    assert len(os.listdir(folder)) == 3
+    ChartCache._written(folder)
+    assert os.listdir(folder) == ["c.png"]
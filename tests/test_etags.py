@@ -0,0 +1,27 @@
+from app import db
+from app.catalog import CatalogCache
+from app.models import Level, UserLevel
+
+
+def test_admin_levels_etag_follows_enrollments(client, make_user, count_queries):
+    _, headers = make_user(role="admin", name="admin")
+    user_id, _ = make_user(name="client")
+    level = Level(name="Level 1", level_number=1, price=10.0)
+    db.session.add(level)
+    CatalogCache.bump_version()
+    db.session.commit()
+
+    first = client.get("/admin/levels", headers=headers)
+    etag = first.headers["ETag"]
+    with count_queries() as statements:
+        unchanged = client.get("/admin/levels", headers={**headers, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+    # The ETag is built without scanning the enrollments
+    assert not [statement for statement in statements if "user_level" in statement]
+
+    assigned = client.post(f"/admin/users/{user_id}/assign_level/{level.id}", headers=headers)
+    assert assigned.status_code == 200
+    changed = client.get("/admin/levels", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json["levels"][0]["user_count"] == 1
+    assert UserLevel.query.count() == 1
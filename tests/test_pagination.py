@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.mark.parametrize("limit", ["abc", "0", "-5", "1.5"])
+def test_invalid_limit_is_rejected(client, make_user, limit):
+    _, headers = make_user(role="admin", name="admin")
+    response = client.get(f"/admin/videos?limit={limit}", headers=headers)
+    assert response.status_code == 400
+
+
+def test_missing_limit_uses_default(client, make_user):
+    _, headers = make_user(role="admin", name="admin")
+    response = client.get("/admin/videos", headers=headers)
+    assert response.status_code == 200
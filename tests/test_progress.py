@@ -0,0 +1,38 @@
+import pytest
+
+from app import db
+from app.models import Level, UserLevel, UserVideoProgress, Video
+from app.progress import ProgressCounters
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "select_after_update"])
+def update_returning(request, app, monkeypatch):
+    """Run a test with and without UPDATE ... RETURNING support"""
+    monkeypatch.setattr(db.engine.dialect, "update_returning", request.param)
+    return request.param
+
+
+def test_mark_completed_counts_each_video_once(make_user, update_returning):
+    user_id, _ = make_user()
+    level = Level(name="Level 1", level_number=1, price=10.0)
+    db.session.add(level)
+    db.session.flush()
+    user_level = UserLevel(user_id=user_id, level_id=level.id)
+    videos = [
+        Video(level_id=level.id, name=f"Video {order}", youtube_link=f"https://youtu.be/{order}", order=order)
+        for order in (1, 2)
+    ]
+    db.session.add_all([user_level, *videos])
+    db.session.flush()
+    progress = [
+        UserVideoProgress(user_level_id=user_level.id, video_id=video.id, is_opened=True)
+        for video in videos
+    ]
+    db.session.add_all(progress)
+    db.session.commit()
+
+    assert ProgressCounters.mark_completed(progress[0]) == 1
+    assert ProgressCounters.mark_completed(progress[0]) is None
+    assert ProgressCounters.mark_completed(progress[1]) == 2
+    db.session.commit()
+    assert db.session.get(UserLevel, user_level.id).completed_videos_count == 2
@@ -0,0 +1,96 @@
+"""The per-request query count of listing endpoints must not grow with data size"""
+import pytest
+
+from app import db
+from app.catalog import CatalogCache
+from app.models import (
+    Level,
+    Question,
+    UserLevel,
+    UserQuestionAnswer,
+    UserVideoProgress,
+    Video,
+)
+from app.progress import ProgressVersions
+
+
+def seed(user_ids, levels, videos, questions):
+    """Create a catalog and give every user progress and answers for all of it"""
+    for level_number in range(1, levels + 1):
+        level = Level(name=f"Level {level_number}", level_number=level_number, price=10.0)
+        db.session.add(level)
+        db.session.flush()
+        user_levels = [UserLevel(user_id=user_id, level_id=level.id) for user_id in user_ids]
+        db.session.add_all(user_levels)
+        db.session.flush()
+
+        for order in range(1, videos + 1):
+            video = Video(
+                level_id=level.id,
+                name=f"Video {order}",
+                youtube_link=f"https://youtu.be/{level.id}-{order}",
+                order=order,
+            )
+            db.session.add(video)
+            db.session.flush()
+            db.session.add_all(
+                UserVideoProgress(
+                    user_level_id=user_level.id,
+                    video_id=video.id,
+                    is_opened=True,
+                    is_completed=order < videos,
+                )
+                for user_level in user_levels
+            )
+            for question_order in range(1, questions + 1):
+                question = Question(
+                    video_id=video.id, text=f"Question {question_order}", order=question_order
+                )
+                db.session.add(question)
+                db.session.flush()
+                db.session.add_all(
+                    UserQuestionAnswer(user_id=user_id, question_id=question.id, percentage=50.0)
+                    for user_id in user_ids
+                )
+    # Writes go through the same invalidation as the admin and client routes
+    CatalogCache.bump_version()
+    for user_id in user_ids:
+        ProgressVersions.bump(user_id)
+    db.session.commit()
+
+
+def measure(client, count_queries, url, headers):
+    # The first request builds the shared catalog cache
+    assert client.get(url, headers=headers).status_code == 200
+    with count_queries() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return len(statements)
+
+
+def test_user_levels_query_count_is_constant(app, client, make_user, count_queries):
+    user_id, headers = make_user()
+    url = f"/users/{user_id}/levels"
+
+    seed([user_id], levels=1, videos=1, questions=1)
+    small = measure(client, count_queries, url, headers)
+
+    seed([user_id], levels=4, videos=6, questions=5)
+    large = measure(client, count_queries, url, headers)
+
+    assert small == large, (small, large)
+
+
+@pytest.mark.parametrize("url", ["/admin/levels", "/admin/videos", "/admin/questions"])
+def test_admin_listing_query_count_is_constant(app, client, make_user, count_queries, url):
+    _, headers = make_user(role="admin", name="admin")
+    user_ids = [make_user(name=f"client{index}")[0] for index in range(3)]
+
+    seed(user_ids[:1], levels=1, videos=1, questions=1)
+    small = measure(client, count_queries, url, headers)
+
+    # More levels, videos, questions, progress rows and answers, on one page
+    seed(user_ids, levels=3, videos=4, questions=3)
+    large = measure(client, count_queries, url, headers)
+
+    assert small == large, (small, large)
@@ -0,0 +1,20 @@
+from app import db
+from app.models import PlatformStatistics
+
+
+def test_statistics_row_is_created_with_the_table(app):
+    stats = db.session.get(PlatformStatistics, 1)
+    assert stats is not None
+    assert stats.total_users == stats.total_purchases == 0
+
+
+def test_statistics_are_read_only(client, make_user, count_queries):
+    _, headers = make_user(role="admin", name="admin")
+    with count_queries() as statements:
+        response = client.get("/admin/statistics", headers=headers)
+    assert response.status_code == 200
+    assert not [
+        statement
+        for statement in statements
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))
+    ]